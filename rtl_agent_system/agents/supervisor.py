@@ -3,8 +3,11 @@ Supervisor & Planning Layer
 최상위 의사결정 및 작업 계획 수립
 """
 from typing import Dict, List, Optional, Any
+from collections import namedtuple
 import asyncio
-import uuid
+import heapq
+import itertools
+import secrets
 from datetime import datetime
 import re
 
@@ -13,20 +16,32 @@ from core.base import (
 )
 
 
+# 모듈명 추출 패턴 (CamelCase, snake_case)
+_CAMEL_RE = re.compile(r'\b[A-Z][a-zA-Z0-9_]*\b')
+_SNAKE_RE = re.compile(r'\b[a-z_][a-z0-9_]+_[a-z0-9_]+\b')
+
+# 계획 템플릿의 하위 작업 명세 (suffix: task_id 접미사, deps: 선행 작업 suffix)
+TaskSpec = namedtuple('TaskSpec', 'suffix task_type description ctx_keys ctx deps')
+
+
 class SupervisorAgent(Agent):
     """
     Supervisor Agent - 전체 시스템을 조율하는 최상위 에이전트
     자연어 명령을 해석하고 실행 계획을 수립
     """
     
+    # task/plan ID용 순차 카운터 - 실행마다 리포트 파일명이 겹치지 않도록
+    # 프로세스별 임의 값에서 시작 (uuid4 생성 비용 없이 8자리 hex 유지)
+    _id_counter = itertools.count(secrets.randbits(32))
+    
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         super().__init__("Supervisor", config)
         self.task_patterns = self._initialize_patterns()
         self.router = DynamicRouter(config)
     
-    def _initialize_patterns(self) -> Dict[str, TaskType]:
-        """작업 유형 판단을 위한 패턴 정의"""
-        return {
+    def _initialize_patterns(self) -> Dict[re.Pattern, TaskType]:
+        """작업 유형 판단을 위한 패턴 정의 (미리 컴파일)"""
+        patterns = {
             r'타이밍|timing|slack|setup|hold': TaskType.TIMING_ANALYSIS,
             r'전력|power|leakage|dynamic': TaskType.POWER_OPTIMIZATION,
             r'수정|fix|modify|change|edit': TaskType.RTL_MODIFICATION,
@@ -34,6 +49,10 @@ class SupervisorAgent(Agent):
             r'검증|verify|lint|check': TaskType.VERIFICATION,
             r'디버그|debug|error|warning': TaskType.DEBUG,
         }
+        return {
+            re.compile(pattern, re.IGNORECASE): task_type
+            for pattern, task_type in patterns.items()
+        }
     
     async def parse_user_command(self, command: str) -> Task:
         """
@@ -48,7 +67,7 @@ class SupervisorAgent(Agent):
         # 작업 유형 판단
         task_type = TaskType.VERIFICATION  # 기본값
         for pattern, ttype in self.task_patterns.items():
-            if re.search(pattern, command, re.IGNORECASE):
+            if pattern.search(command):
                 task_type = ttype
                 break
         
@@ -57,7 +76,7 @@ class SupervisorAgent(Agent):
         
         # Task 생성
         task = Task(
-            task_id=f"task_{uuid.uuid4().hex[:8]}",
+            task_id=f"task_{self._new_id()}",
             task_type=task_type,
             description=command,
             context={
@@ -75,21 +94,21 @@ class SupervisorAgent(Agent):
         
         return task
     
+    def _new_id(self) -> str:
+        """8자리 hex ID 생성"""
+        return f"{next(self._id_counter) & 0xFFFFFFFF:08x}"
+    
     def _extract_module_names(self, text: str) -> List[str]:
         """텍스트에서 모듈명 추출"""
         # 대문자로 시작하는 단어나 snake_case 패턴 추출
-        patterns = [
-            r'\b[A-Z][a-zA-Z0-9_]*\b',  # CamelCase
-            r'\b[a-z_][a-z0-9_]+_[a-z0-9_]+\b'  # snake_case
-        ]
-        modules = []
-        for pattern in patterns:
-            modules.extend(re.findall(pattern, text))
+        modules = _CAMEL_RE.findall(text)
+        modules.extend(_SNAKE_RE.findall(text))
         return list(set(modules))
     
     def _is_korean(self, text: str) -> bool:
         """한글 포함 여부 확인"""
-        return bool(re.search(r'[ㄱ-ㅎㅏ-ㅣ가-힣]', text))
+        # 완성형(가-힣) 및 호환 자모(ㄱ-ㅣ) 범위를 코드포인트로 직접 비교
+        return any('가' <= ch <= '힣' or 'ㄱ' <= ch <= 'ㅣ' for ch in text)
     
     async def create_execution_plan(self, task: Task) -> ExecutionPlan:
         """
@@ -101,23 +120,13 @@ class SupervisorAgent(Agent):
         Returns:
             ExecutionPlan with sub-tasks and dependencies
         """
-        plan_id = f"plan_{uuid.uuid4().hex[:8]}"
-        sub_tasks = []
-        dependencies = {}
+        plan_id = f"plan_{self._new_id()}"
         
-        # Task 타입별 계획 수립
-        if task.task_type == TaskType.TIMING_ANALYSIS:
-            sub_tasks, dependencies = await self._plan_timing_analysis(task)
-        elif task.task_type == TaskType.RTL_MODIFICATION:
-            sub_tasks, dependencies = await self._plan_rtl_modification(task)
-        elif task.task_type == TaskType.SCRIPT_TUNING:
-            sub_tasks, dependencies = await self._plan_script_tuning(task)
-        elif task.task_type == TaskType.VERIFICATION:
-            sub_tasks, dependencies = await self._plan_verification(task)
-        elif task.task_type == TaskType.POWER_OPTIMIZATION:
-            sub_tasks, dependencies = await self._plan_power_optimization(task)
-        else:  # DEBUG
-            sub_tasks, dependencies = await self._plan_debug(task)
+        # Task 타입별 계획 템플릿 적용 (그 외 타입은 디버그 계획)
+        template = self._PLAN_TEMPLATES.get(
+            task.task_type, self._PLAN_TEMPLATES[TaskType.DEBUG]
+        )
+        sub_tasks, dependencies = self._materialize_plan(task, template)
         
         plan = ExecutionPlan(
             plan_id=plan_id,
@@ -137,170 +146,80 @@ class SupervisorAgent(Agent):
         
         return plan
     
-    async def _plan_timing_analysis(self, task: Task) -> tuple:
-        """타이밍 분석 계획 수립"""
-        sub_tasks = []
-        dependencies = {}
-        
-        # 1. KG에서 타겟 모듈의 컨텍스트 로드
-        t1 = Task(
-            task_id=f"{task.task_id}_kg_load",
-            task_type=TaskType.VERIFICATION,
-            description="Load module context from Knowledge Graph",
-            context={'target_modules': task.context.get('target_modules', [])}
-        )
-        sub_tasks.append(t1)
-        dependencies[t1.task_id] = []
-        
-        # 2. PrimeTime 스크립트 생성
-        t2 = Task(
-            task_id=f"{task.task_id}_gen_script",
-            task_type=TaskType.SCRIPT_TUNING,
-            description="Generate PrimeTime timing analysis script",
-            context={'tool': 'PrimeTime'}
-        )
-        sub_tasks.append(t2)
-        dependencies[t2.task_id] = [t1.task_id]
-        
-        # 3. 타이밍 분석 실행
-        t3 = Task(
-            task_id=f"{task.task_id}_run_sta",
-            task_type=TaskType.TIMING_ANALYSIS,
-            description="Run static timing analysis",
-            context={'tool': 'PrimeTime'}
-        )
-        sub_tasks.append(t3)
-        dependencies[t3.task_id] = [t2.task_id]
-        
-        # 4. 로그 분석 및 해결책 제안
-        t4 = Task(
-            task_id=f"{task.task_id}_analyze",
-            task_type=TaskType.DEBUG,
-            description="Analyze timing violations and suggest fixes",
-            context={}
-        )
-        sub_tasks.append(t4)
-        dependencies[t4.task_id] = [t3.task_id]
-        
-        return sub_tasks, dependencies
-    
-    async def _plan_rtl_modification(self, task: Task) -> tuple:
-        """RTL 수정 계획 수립"""
-        sub_tasks = []
-        dependencies = {}
-        
-        # 1. RTL 코드 분석
-        t1 = Task(
-            task_id=f"{task.task_id}_analyze_rtl",
-            task_type=TaskType.VERIFICATION,
-            description="Analyze RTL code structure",
-            context=task.context
-        )
-        sub_tasks.append(t1)
-        dependencies[t1.task_id] = []
-        
-        # 2. 수정 사항 생성
-        t2 = Task(
-            task_id=f"{task.task_id}_gen_fix",
-            task_type=TaskType.RTL_MODIFICATION,
-            description="Generate RTL modifications",
-            context=task.context
-        )
-        sub_tasks.append(t2)
-        dependencies[t2.task_id] = [t1.task_id]
-        
-        # 3. Lint 검증
-        t3 = Task(
-            task_id=f"{task.task_id}_lint",
-            task_type=TaskType.VERIFICATION,
-            description="Run lint check on modified RTL",
-            context={'tool': 'SpyGlass'}
-        )
-        sub_tasks.append(t3)
-        dependencies[t3.task_id] = [t2.task_id]
-        
-        return sub_tasks, dependencies
-    
-    async def _plan_script_tuning(self, task: Task) -> tuple:
-        """스크립트 튜닝 계획"""
-        sub_tasks = []
-        dependencies = {}
-        
-        t1 = Task(
-            task_id=f"{task.task_id}_load_template",
-            task_type=TaskType.VERIFICATION,
-            description="Load script template",
-            context=task.context
-        )
-        sub_tasks.append(t1)
-        dependencies[t1.task_id] = []
-        
-        t2 = Task(
-            task_id=f"{task.task_id}_optimize",
-            task_type=TaskType.SCRIPT_TUNING,
-            description="Optimize script parameters",
-            context=task.context
-        )
-        sub_tasks.append(t2)
-        dependencies[t2.task_id] = [t1.task_id]
-        
-        return sub_tasks, dependencies
-    
-    async def _plan_verification(self, task: Task) -> tuple:
-        """검증 계획"""
-        sub_tasks = []
-        dependencies = {}
-        
-        t1 = Task(
-            task_id=f"{task.task_id}_verify",
-            task_type=TaskType.VERIFICATION,
-            description="Run verification checks",
-            context=task.context
-        )
-        sub_tasks.append(t1)
-        dependencies[t1.task_id] = []
-        
-        return sub_tasks, dependencies
-    
-    async def _plan_power_optimization(self, task: Task) -> tuple:
-        """전력 최적화 계획"""
-        sub_tasks = []
-        dependencies = {}
-        
-        # Similar structure to timing analysis
-        t1 = Task(
-            task_id=f"{task.task_id}_power_analysis",
-            task_type=TaskType.POWER_OPTIMIZATION,
-            description="Analyze power consumption",
-            context=task.context
-        )
-        sub_tasks.append(t1)
-        dependencies[t1.task_id] = []
-        
-        return sub_tasks, dependencies
+    # Task 타입별 계획 템플릿 (하위 작업은 순서대로 나열)
+    # ctx_keys가 None이면 상위 Task의 context를 그대로 공유하고,
+    # 튜플이면 해당 키만 복사(없으면 빈 리스트)한 뒤 ctx의 고정 값을 더함
+    _PLAN_TEMPLATES: Dict[TaskType, List[TaskSpec]] = {
+        # 타이밍 분석: KG 로드 -> PrimeTime 스크립트 생성 -> STA 실행 -> 로그 분석
+        TaskType.TIMING_ANALYSIS: [
+            TaskSpec('kg_load', TaskType.VERIFICATION,
+                     "Load module context from Knowledge Graph",
+                     ('target_modules',), {}, ()),
+            TaskSpec('gen_script', TaskType.SCRIPT_TUNING,
+                     "Generate PrimeTime timing analysis script",
+                     (), {'tool': 'PrimeTime'}, ('kg_load',)),
+            TaskSpec('run_sta', TaskType.TIMING_ANALYSIS,
+                     "Run static timing analysis",
+                     (), {'tool': 'PrimeTime'}, ('gen_script',)),
+            TaskSpec('analyze', TaskType.DEBUG,
+                     "Analyze timing violations and suggest fixes",
+                     (), {}, ('run_sta',)),
+        ],
+        # RTL 수정: 코드 분석 -> 수정 사항 생성 -> Lint 검증
+        TaskType.RTL_MODIFICATION: [
+            TaskSpec('analyze_rtl', TaskType.VERIFICATION,
+                     "Analyze RTL code structure", None, {}, ()),
+            TaskSpec('gen_fix', TaskType.RTL_MODIFICATION,
+                     "Generate RTL modifications", None, {}, ('analyze_rtl',)),
+            TaskSpec('lint', TaskType.VERIFICATION,
+                     "Run lint check on modified RTL",
+                     (), {'tool': 'SpyGlass'}, ('gen_fix',)),
+        ],
+        # 스크립트 튜닝: 템플릿 로드 -> 파라미터 최적화
+        TaskType.SCRIPT_TUNING: [
+            TaskSpec('load_template', TaskType.VERIFICATION,
+                     "Load script template", None, {}, ()),
+            TaskSpec('optimize', TaskType.SCRIPT_TUNING,
+                     "Optimize script parameters", None, {}, ('load_template',)),
+        ],
+        TaskType.VERIFICATION: [
+            TaskSpec('verify', TaskType.VERIFICATION,
+                     "Run verification checks", None, {}, ()),
+        ],
+        TaskType.POWER_OPTIMIZATION: [
+            TaskSpec('power_analysis', TaskType.POWER_OPTIMIZATION,
+                     "Analyze power consumption", None, {}, ()),
+        ],
+        # 디버그: 근본 원인 파악 -> 해결책 제안
+        TaskType.DEBUG: [
+            TaskSpec('identify_issue', TaskType.DEBUG,
+                     "Identify root cause", None, {}, ()),
+            TaskSpec('suggest_fix', TaskType.DEBUG,
+                     "Suggest fixes", None, {}, ('identify_issue',)),
+        ],
+    }
     
-    async def _plan_debug(self, task: Task) -> tuple:
-        """디버그 계획"""
-        sub_tasks = []
-        dependencies = {}
-        
-        t1 = Task(
-            task_id=f"{task.task_id}_identify_issue",
-            task_type=TaskType.DEBUG,
-            description="Identify root cause",
-            context=task.context
-        )
-        sub_tasks.append(t1)
-        dependencies[t1.task_id] = []
-        
-        t2 = Task(
-            task_id=f"{task.task_id}_suggest_fix",
-            task_type=TaskType.DEBUG,
-            description="Suggest fixes",
-            context=task.context
-        )
-        sub_tasks.append(t2)
-        dependencies[t2.task_id] = [t1.task_id]
+    def _materialize_plan(self, task: Task, template: List[TaskSpec]) -> tuple:
+        """계획 템플릿에 상위 Task의 ID와 context를 채워 하위 작업 생성"""
+        prefix = task.task_id
+        context = task.context
+        
+        sub_tasks = [
+            Task(
+                task_id=f"{prefix}_{spec.suffix}",
+                task_type=spec.task_type,
+                description=spec.description,
+                context=context if spec.ctx_keys is None else {
+                    **{key: context.get(key, []) for key in spec.ctx_keys},
+                    **spec.ctx
+                }
+            )
+            for spec in template
+        ]
+        dependencies = {
+            f"{prefix}_{spec.suffix}": [f"{prefix}_{dep}" for dep in spec.deps]
+            for spec in template
+        }
         
         return sub_tasks, dependencies
     
@@ -320,7 +239,7 @@ class SupervisorAgent(Agent):
             summary=summary,
             details={
                 'plan_id': plan.plan_id,
-                'results': [r.__dict__ for r in results]
+                'results': results  # AnalysisResult 객체 (직렬화 시 to_dict)
             }
         )
 
@@ -346,38 +265,60 @@ class DynamicRouter:
         return agent
     
     async def execute_plan(self, plan: ExecutionPlan) -> List[AnalysisResult]:
-        """실행 계획을 순차적으로 실행"""
-        completed = set()
-        results = []
+        """
+        실행 계획을 의존성 순서대로 실행
         
-        while len(completed) < len(plan.tasks):
-            # 실행 가능한 작업 찾기
-            next_tasks = plan.get_next_tasks(completed)
-            
-            if not next_tasks:
-                # 순환 의존성 또는 문제 발생
-                break
-            
-            # 병렬 실행
-            task_results = await asyncio.gather(
-                *[self._execute_task(task) for task in next_tasks],
-                return_exceptions=True
-            )
+        레이어 단위로 기다리지 않고, 작업이 끝날 때마다 의존성이 해소된
+        후속 작업을 즉시 디스패치한다. 동시에 여러 작업이 준비되면
+        크리티컬 패스가 긴(후속 체인이 깊은) 작업부터 시작한다.
+        config['max_concurrent']가 있으면 동시 실행 수를 제한한다.
+        """
+        order = {task.task_id: i for i, task in enumerate(plan.tasks)}
+        max_concurrent = self.config.get('max_concurrent')
+        
+        results: Dict[str, AnalysisResult] = {}
+        running: Dict[asyncio.Future, Task] = {}
+        ready: List[tuple] = []  # (-rank, 계획 순서, task_id, task) 힙
+        
+        def make_ready(tasks: List[Task]):
+            for task in tasks:
+                heapq.heappush(
+                    ready,
+                    (-plan.get_rank(task.task_id), order[task.task_id], task.task_id, task)
+                )
+        
+        def dispatch_ready():
+            while ready and (not max_concurrent or len(running) < max_concurrent):
+                task = heapq.heappop(ready)[3]
+                running[asyncio.ensure_future(self._execute_task(task))] = task
+        
+        make_ready(plan.reset_progress())
+        dispatch_ready()
+        
+        # 순환 의존성이 있으면 해당 작업들은 디스패치되지 않음
+        while running:
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
             
-            for task, result in zip(next_tasks, task_results):
-                if isinstance(result, Exception):
+            for future in done:
+                task = running.pop(future)
+                try:
+                    result = future.result()
+                except Exception as e:
                     result = AnalysisResult(
                         success=False,
-                        summary=f"Task failed: {str(result)}",
-                        details={'error': str(result)},
-                        errors=[str(result)]
+                        summary=f"Task failed: {str(e)}",
+                        details={'error': str(e)},
+                        errors=[str(e)]
                     )
                 
-                results.append(result)
-                completed.add(task.task_id)
+                results[task.task_id] = result
                 task.status = TaskStatus.COMPLETED if result.success else TaskStatus.FAILED
+                make_ready(plan.mark_done(task.task_id))
+            
+            dispatch_ready()
         
-        return results
+        # 계획 순서대로 결과 반환
+        return [results[task.task_id] for task in plan.tasks if task.task_id in results]
     
     async def _execute_task(self, task: Task) -> AnalysisResult:
         """개별 작업 실행"""
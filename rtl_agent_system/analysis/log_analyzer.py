@@ -2,17 +2,50 @@
 Log Analysis & Feedback System
 EDA 툴 출력 로그 분석 및 피드백 생성
 """
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Deque, Dict, List, Optional, Any, Tuple
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+import asyncio
+import mmap
+import os
 import re
 from pathlib import Path
 from dataclasses import dataclass, field
 from datetime import datetime
 import json
 
+try:
+    # 선택 의존성: google-re2 (DFA 기반, 백트래킹 없음) - 대용량 로그 스캔용
+    import re2 as _scan_re
+except ImportError:
+    _scan_re = re
+
 from core.base import Agent, Task, AnalysisResult, TaskStatus
 
 
-@dataclass
+# 대용량 로그 읽기 버퍼 크기
+LOG_READ_BUFFER_SIZE = 1024 * 1024
+
+# 이 크기 이상의 파일은 청크로 나눠 여러 프로세스에서 병렬 스캔
+PARALLEL_SCAN_MIN_BYTES = 64 * 1024 * 1024
+
+# 타이밍 리포트 시작/끝 포인트 패턴
+_STARTPOINT_RE = re.compile(r'Startpoint:\s*(\S+)', re.IGNORECASE)
+_ENDPOINT_RE = re.compile(r'Endpoint:\s*(\S+)', re.IGNORECASE)
+_POINT_RE = re.compile(r'([a-zA-Z_][\w/\[\]\.]*(?:/[a-zA-Z_][\w]*)?)')
+
+# 에러 카테고리 분류 패턴 (앞선 카테고리가 우선, 소문자로 변환한 메시지에 적용)
+_CATEGORY_RE = re.compile(
+    r'(?:.*?(?P<syntax>syntax|parse|expected)'
+    r'|.*?(?P<timing>timing|slack|delay)'
+    r'|.*?(?P<constraint>constraint|sdc)'
+    r'|.*?(?P<netlist>netlist|port|instance)'
+    r'|.*?(?P<library>library|cell|lib))',
+    re.DOTALL
+)
+
+
+@dataclass(slots=True)
 class LogEntry:
     """로그 엔트리"""
     severity: str  # ERROR, WARNING, INFO
@@ -35,7 +68,7 @@ class LogEntry:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class TimingViolation:
     """타이밍 위반 정보"""
     path_type: str  # setup, hold
@@ -58,22 +91,75 @@ class TimingViolation:
         }
 
 
+def _chunk_bounds(path: str, max_workers: int, separator: bytes) -> List[Tuple[int, int]]:
+    """
+    파일을 separator 직후 위치에 맞춘 (start, end) 바이트 구간들로 분할
+    
+    작은 파일이나 단일 워커면 구간 하나만 반환 (병렬 스캔하지 않음)
+    """
+    size = os.path.getsize(path)
+    if max_workers <= 1 or size < PARALLEL_SCAN_MIN_BYTES:
+        return [(0, size)]
+    
+    starts = [0]
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        for i in range(1, max_workers):
+            pos = mm.find(separator, max(i * size // max_workers, starts[-1]))
+            if pos == -1:
+                break
+            pos += len(separator)
+            if pos < size and pos > starts[-1]:
+                starts.append(pos)
+    
+    return list(zip(starts, starts[1:] + [size]))
+
+
+def _scan_log_chunk(log_path: str,
+                    start: int,
+                    end: int,
+                    max_entries: int) -> Tuple[int, List[LogEntry]]:
+    """워커 프로세스용 로그 청크 스캔 (패턴은 워커에서 다시 컴파일)"""
+    return LogReducer(max_workers=1)._scan_range(log_path, start, end, max_entries)
+
+
+def _scan_timing_chunk(report_path: str, start: int, end: int) -> List[TimingViolation]:
+    """워커 프로세스용 타이밍 리포트 청크 파싱"""
+    return LogReducer(max_workers=1)._scan_timing_range(report_path, start, end)
+
+
+def to_dicts(entries: List[LogEntry]) -> List[Dict[str, Any]]:
+    """LogEntry 리스트를 딕셔너리 리스트로 변환 (JSON 직렬화 경계에서 사용)"""
+    return [entry.to_dict() for entry in entries]
+
+
 class LogReducer:
     """
     로그 리듀서 - 대용량 로그에서 핵심 정보만 추출
     """
     
-    def __init__(self):
+    def __init__(self, max_workers: Optional[int] = None):
         self.patterns = self._initialize_patterns()
+        # 대용량 파일 병렬 스캔에 사용할 최대 프로세스 수
+        self.max_workers = max_workers or os.cpu_count() or 1
     
-    def _initialize_patterns(self) -> Dict[str, re.Pattern]:
+    def _initialize_patterns(self) -> Dict[str, Any]:
         """로그 패턴 초기화"""
+        # 라인별로 실행되는 패턴은 디코딩 없이 bytes에 바로 적용하며,
+        # re2가 있으면 re2로 컴파일 (re2.compile은 플래그 인자가 없으므로
+        # 인라인 (?i) 사용, bytes 패턴의 named group은 re2에서 지원되지 않음)
         return {
-            'error': re.compile(r'Error[:\s]+(.+)', re.IGNORECASE),
-            'warning': re.compile(r'Warning[:\s]+(.+)', re.IGNORECASE),
-            'info': re.compile(r'Info[:\s]+(.+)', re.IGNORECASE),
-            'error_code': re.compile(r'([A-Z]+-\d+)'),
-            'file_line': re.compile(r'File:\s*(.+?)\s+Line:\s*(\d+)', re.IGNORECASE),
+            # Error > Warning > Info 우선순위를 유지하는 단일 패스 심각도 패턴
+            # 그룹: 1=Error, 2=Warning, 3=Info, 4=메시지
+            'severity': _scan_re.compile(
+                rb'(?i)(?:.*?(Error)[:\s]+'
+                rb'|.*?(Warning)[:\s]+'
+                rb'|.*?(Info)[:\s]+)(.+)'
+            ),
+            # 심각도 후보 라인을 찾는 블록 단위 키워드 검색 패턴
+            # (소문자로 변환한 블록에 적용 - IGNORECASE보다 re 폴백에서 빠름)
+            'severity_keyword': _scan_re.compile(rb'error|warning|info'),
+            'error_code': _scan_re.compile(rb'([A-Z]+-\d+)'),
+            'file_line': _scan_re.compile(rb'(?i)File:\s*(.+?)\s+Line:\s*(\d+)'),
             'timing_slack': re.compile(r'slack\s*(?:\(.*?\))?\s*:\s*([-+]?\d+\.?\d*)', re.IGNORECASE),
         }
     
@@ -88,73 +174,145 @@ class LogReducer:
         Returns:
             요약된 로그 정보
         """
-        with open(log_path, 'r', encoding='utf-8', errors='ignore') as f:
-            lines = f.readlines()
-        
+        bounds = _chunk_bounds(log_path, self.max_workers, b'\n')
+        
+        if len(bounds) > 1:
+            # 라인 정렬된 청크를 프로세스 풀에서 병렬 스캔 (청크별로 max_entries까지만)
+            loop = asyncio.get_running_loop()
+            with ProcessPoolExecutor(max_workers=len(bounds)) as pool:
+                chunks = await asyncio.gather(*[
+                    loop.run_in_executor(
+                        pool, _scan_log_chunk, log_path, start, end, max_entries
+                    )
+                    for start, end in bounds
+                ])
+        else:
+            chunks = [self._scan_range(log_path, 0, None, max_entries)]
+        
+        # 청크 순서대로 병합하며 라인 번호를 파일 기준으로 재계산
         entries = []
-        error_count = 0
-        warning_count = 0
-        info_count = 0
-        
-        for i, line in enumerate(lines):
-            line = line.strip()
-            if not line:
-                continue
-            
-            # 에러 매칭
-            if match := self.patterns['error'].search(line):
-                entry = self._create_log_entry('ERROR', match.group(1), i, line)
-                entries.append(entry)
-                error_count += 1
-            
-            # 경고 매칭
-            elif match := self.patterns['warning'].search(line):
-                entry = self._create_log_entry('WARNING', match.group(1), i, line)
+        total_lines = 0
+        truncated = False
+        for line_count, chunk_entries in chunks:
+            for entry in chunk_entries:
+                entry.line_number += total_lines
                 entries.append(entry)
-                warning_count += 1
-            
-            # 정보 매칭
-            elif match := self.patterns['info'].search(line):
-                entry = self._create_log_entry('INFO', match.group(1), i, line)
-                entries.append(entry)
-                info_count += 1
-            
-            # 최대 엔트리 수 제한
-            if len(entries) >= max_entries:
+                # 최대 엔트리 수 제한
+                if len(entries) >= max_entries:
+                    truncated = True
+                    break
+            if truncated:
+                total_lines = entries[-1].line_number + 1
                 break
+            total_lines += line_count
+        
+        severities = Counter(entry.severity for entry in entries)
         
         return {
             'log_file': log_path,
-            'total_lines': len(lines),
-            'error_count': error_count,
-            'warning_count': warning_count,
-            'info_count': info_count,
-            'entries': [e.to_dict() for e in entries],
+            'total_lines': total_lines,  # truncated이면 스캔한 라인 수
+            'truncated': truncated,
+            'error_count': severities['ERROR'],
+            'warning_count': severities['WARNING'],
+            'info_count': severities['INFO'],
+            'entries': entries,  # LogEntry 객체 (필요 시 to_dicts로 변환)
             'timestamp': datetime.now().isoformat()
         }
     
+    def _scan_range(self,
+                    log_path: str,
+                    start: int,
+                    end: Optional[int],
+                    max_entries: int) -> Tuple[int, List[LogEntry]]:
+        """
+        [start, end) 바이트 구간을 스캔 (end가 None이면 파일 끝까지)
+        
+        Returns:
+            (구간 라인 수, 구간 기준 라인 번호의 엔트리 리스트)
+        """
+        entries = []
+        line_count = 0  # 이전 블록까지의 라인 수
+        remaining = end - start if end is not None else None
+        keyword_re = self.patterns['severity_keyword']
+        severity_re = self.patterns['severity']
+        
+        # 라인마다 인터프리터 루프를 돌지 않고, 라인 정렬된 블록 단위로 읽어
+        # 심각도 키워드 검색(C 레벨)에 걸린 후보 라인만 파이썬에서 처리
+        with open(log_path, 'rb', buffering=0) as f:
+            f.seek(start)
+            while remaining is None or remaining > 0:
+                size = LOG_READ_BUFFER_SIZE
+                if remaining is not None:
+                    size = min(size, remaining)
+                buf = f.read(size)
+                if not buf:
+                    break
+                if not buf.endswith(b'\n') and len(buf) == size:
+                    # 블록을 라인 경계에 맞춤 (구간 끝은 항상 라인 시작이므로 넘지 않음)
+                    buf += f.readline()
+                if remaining is not None:
+                    remaining -= len(buf)
+                
+                lowered = buf.lower()
+                line_no = line_count
+                counted = 0
+                pos = 0
+                while match := keyword_re.search(lowered, pos):
+                    sol = buf.rfind(b'\n', 0, match.start()) + 1
+                    eol = buf.find(b'\n', match.end())
+                    if eol == -1:
+                        eol = len(buf)
+                    pos = eol + 1
+                    
+                    line_no += buf.count(b'\n', counted, sol)
+                    counted = sol
+                    
+                    stripped = buf[sol:eol].strip()
+                    match = severity_re.match(stripped)
+                    if not match:
+                        continue
+                    
+                    if match.group(1):
+                        severity = 'ERROR'
+                    elif match.group(2):
+                        severity = 'WARNING'
+                    else:
+                        severity = 'INFO'
+                    
+                    entries.append(
+                        self._create_log_entry(severity, match.group(4), line_no, stripped)
+                    )
+                    if len(entries) >= max_entries:
+                        return line_no + 1, entries
+                
+                line_count += buf.count(b'\n')
+                if not buf.endswith(b'\n'):
+                    line_count += 1
+        
+        return line_count, entries
+    
     def _create_log_entry(self, 
                          severity: str, 
-                         message: str, 
+                         message: bytes, 
                          line_num: int,
-                         full_line: str) -> LogEntry:
+                         full_line: bytes) -> LogEntry:
         """로그 엔트리 생성"""
         
         # 에러 코드 추출
         code = None
         if match := self.patterns['error_code'].search(full_line):
-            code = match.group(1)
+            code = match.group(1).decode('ascii')
         
         # 파일 및 라인 번호 추출
         file = None
         file_line = None
         if match := self.patterns['file_line'].search(full_line):
-            file = match.group(1)
+            file = match.group(1).decode('utf-8', errors='ignore')
             file_line = int(match.group(2))
         
         return LogEntry(
             severity=severity,
-            message=message,
+            message=message.decode('utf-8', errors='ignore'),
             line_number=line_num,
             file=file,
             code=code
@@ -170,51 +328,105 @@ class LogReducer:
         Returns:
             타이밍 위반 리스트
         """
-        with open(report_path, 'r', encoding='utf-8', errors='ignore') as f:
-            content = f.read()
-        
+        # 경로 블록이 청크 경계에 걸치지 않도록 빈 줄 위치에서 분할
+        bounds = _chunk_bounds(report_path, self.max_workers, b'\n\n')
+        
+        if len(bounds) > 1:
+            loop = asyncio.get_running_loop()
+            with ProcessPoolExecutor(max_workers=len(bounds)) as pool:
+                chunks = await asyncio.gather(*[
+                    loop.run_in_executor(
+                        pool, _scan_timing_chunk, report_path, start, end
+                    )
+                    for start, end in bounds
+                ])
+            return [violation for chunk in chunks for violation in chunk]
+        
+        return self._scan_timing_range(report_path, 0, None)
+    
+    def _scan_timing_range(self,
+                           report_path: str,
+                           start: int,
+                           end: Optional[int]) -> List[TimingViolation]:
+        """[start, end) 바이트 구간의 타이밍 경로 블록 파싱 (end가 None이면 파일 끝까지)"""
         violations = []
+        block: List[bytes] = []
+        remaining = end - start if end is not None else None
         
-        # 타이밍 경로 블록 찾기
+        # 빈 줄 기준으로 경로 블록을 스트리밍 처리 (slack이 있는 블록만 디코딩)
         # 간단한 파싱 (실제로는 툴별로 다른 포맷 처리 필요)
-        path_blocks = re.split(r'\n\s*\n', content)
-        
-        for block in path_blocks:
-            if 'slack' not in block.lower():
-                continue
-            
-            # Slack 추출
-            slack_match = self.patterns['timing_slack'].search(block)
-            if not slack_match:
-                continue
-            
-            slack = float(slack_match.group(1))
-            
-            # 위반이 아니면 스킵 (slack >= 0)
-            if slack >= 0:
-                continue
-            
-            # 경로 타입 판단
-            path_type = 'setup' if 'max' in block.lower() else 'hold'
-            
-            # 시작/끝 포인트 추출 (간단한 휴리스틱)
-            points = re.findall(r'([a-zA-Z_][\w/\[\]\.]*(?:/[a-zA-Z_][\w]*)?)', block)
-            start_point = points[0] if points else "unknown"
-            end_point = points[-1] if len(points) > 1 else "unknown"
-            
-            violation = TimingViolation(
-                path_type=path_type,
-                slack=slack,
-                required_time=0.0,  # 실제로는 파싱 필요
-                arrival_time=0.0,
-                start_point=start_point,
-                end_point=end_point
-            )
-            
-            violations.append(violation)
+        with open(report_path, 'rb', buffering=LOG_READ_BUFFER_SIZE) as f:
+            f.seek(start)
+            for line in f:
+                if remaining is not None:
+                    remaining -= len(line)
+                
+                if line.strip():
+                    block.append(line)
+                elif block:
+                    violation = self._parse_timing_block(block)
+                    if violation:
+                        violations.append(violation)
+                    block = []
+                
+                if remaining is not None and remaining <= 0:
+                    break
+        
+        if block:
+            violation = self._parse_timing_block(block)
+            if violation:
+                violations.append(violation)
         
         return violations
     
+    def _parse_timing_block(self, lines: List[bytes]) -> Optional[TimingViolation]:
+        """타이밍 경로 블록 하나를 파싱 (위반이 아니면 None)"""
+        raw = b''.join(lines)
+        if b'slack' not in raw.lower():
+            return None
+        
+        block = raw.decode('utf-8', errors='ignore')
+        lowered = block.lower()
+        
+        # Slack 추출
+        slack_match = self.patterns['timing_slack'].search(block)
+        if not slack_match:
+            return None
+        
+        slack = float(slack_match.group(1))
+        
+        # 위반이 아니면 스킵 (slack >= 0)
+        if slack >= 0:
+            return None
+        
+        # 경로 타입 판단
+        path_type = 'setup' if 'max' in lowered else 'hold'
+        
+        # 시작/끝 포인트 추출: Startpoint/Endpoint 라인 우선,
+        # 없으면 블록의 첫/마지막 라인에서만 휴리스틱 검색
+        if match := _STARTPOINT_RE.search(block):
+            start_point = match.group(1)
+        else:
+            match = _POINT_RE.search(lines[0].decode('utf-8', errors='ignore'))
+            start_point = match.group(1) if match else "unknown"
+        
+        if match := _ENDPOINT_RE.search(block):
+            end_point = match.group(1)
+        elif len(lines) > 1 and (
+                match := _POINT_RE.search(lines[-1].decode('utf-8', errors='ignore'))):
+            end_point = match.group(1)
+        else:
+            end_point = "unknown"
+        
+        return TimingViolation(
+            path_type=path_type,
+            slack=slack,
+            required_time=0.0,  # 실제로는 파싱 필요
+            arrival_time=0.0,
+            start_point=start_point,
+            end_point=end_point
+        )
+    
     async def parse_lint_report(self, report_path: str) -> Dict[str, Any]:
         """
         린트 리포트 파싱
@@ -228,18 +440,17 @@ class LogReducer:
         reduced_log = await self.reduce_log(report_path)
         
         # 룰별 위반 카운트
-        rule_violations = {}
-        for entry in reduced_log['entries']:
-            if entry['severity'] in ['ERROR', 'WARNING']:
-                code = entry.get('code', 'UNKNOWN')
-                rule_violations[code] = rule_violations.get(code, 0) + 1
+        rule_violations = Counter(
+            entry.code for entry in reduced_log['entries']
+            if entry.severity in ('ERROR', 'WARNING')
+        )
         
         return {
             'total_violations': reduced_log['error_count'] + reduced_log['warning_count'],
             'error_count': reduced_log['error_count'],
             'warning_count': reduced_log['warning_count'],
-            'rule_violations': rule_violations,
-            'entries': reduced_log['entries'][:100]  # 상위 100개만
+            'rule_violations': dict(rule_violations),
+            'entries': to_dicts(reduced_log['entries'][:100])  # 상위 100개만
         }
 
 
@@ -294,7 +505,7 @@ class AnalysisAgent(Agent):
         # 치명적 에러 찾기
         critical_errors = [
             entry for entry in reduced_log['entries']
-            if entry['severity'] == 'ERROR'
+            if entry.severity == 'ERROR'
         ]
         
         # 에러 패턴 분석
@@ -310,39 +521,22 @@ class AnalysisAgent(Agent):
             'summary': summary,
             'error_count': error_count,
             'warning_count': warning_count,
-            'critical_errors': critical_errors[:10],  # 상위 10개
+            'critical_errors': to_dicts(critical_errors[:10]),  # 상위 10개
             'error_patterns': error_patterns,
-            'errors': [e['message'] for e in critical_errors[:5]],
-            'warnings': [e['message'] for e in reduced_log['entries'] 
-                        if e['severity'] == 'WARNING'][:5]
+            'errors': [e.message for e in critical_errors[:5]],
+            'warnings': [e.message for e in reduced_log['entries'] 
+                        if e.severity == 'WARNING'][:5]
         }
     
-    def _categorize_errors(self, errors: List[Dict[str, Any]]) -> Dict[str, int]:
+    def _categorize_errors(self, errors: List[LogEntry]) -> Dict[str, int]:
         """에러 카테고리화"""
-        categories = {
-            'syntax': 0,
-            'timing': 0,
-            'constraint': 0,
-            'netlist': 0,
-            'library': 0,
-            'other': 0
-        }
-        
-        for error in errors:
-            message = error['message'].lower()
-            
-            if any(kw in message for kw in ['syntax', 'parse', 'expected']):
-                categories['syntax'] += 1
-            elif any(kw in message for kw in ['timing', 'slack', 'delay']):
-                categories['timing'] += 1
-            elif any(kw in message for kw in ['constraint', 'sdc']):
-                categories['constraint'] += 1
-            elif any(kw in message for kw in ['netlist', 'port', 'instance']):
-                categories['netlist'] += 1
-            elif any(kw in message for kw in ['library', 'cell', 'lib']):
-                categories['library'] += 1
-            else:
-                categories['other'] += 1
+        categories = dict.fromkeys(
+            ('syntax', 'timing', 'constraint', 'netlist', 'library', 'other'), 0
+        )
+        categories.update(Counter(
+            match.lastgroup if match else 'other'
+            for match in (_CATEGORY_RE.match(error.message.lower()) for error in errors)
+        ))
         
         return categories
     
@@ -396,9 +590,10 @@ class FeedbackLoop:
     피드백 루프 - 분석 결과를 바탕으로 자동 수정 시도
     """
     
-    def __init__(self, max_iterations: int = 3):
+    def __init__(self, max_iterations: int = 3, max_history: int = 32):
         self.max_iterations = max_iterations
-        self.iteration_history: List[Dict[str, Any]] = []
+        # 반복별 요약 레코드만 최근 max_history개까지 유지
+        self.iteration_history: Deque[Dict[str, Any]] = deque(maxlen=max_history)
     
     async def run(self,
                  initial_task: Task,
@@ -421,11 +616,13 @@ class FeedbackLoop:
             # 분석 실행
             result = await analysis_agent.process(current_task)
             
-            # 이력 저장
+            # 이력 저장 (details 전체 대신 요약만 보관)
             self.iteration_history.append({
                 'iteration': iteration,
                 'task_id': current_task.task_id,
-                'result': result.__dict__,
+                'success': result.success,
+                'summary': result.summary,
+                'errors': list(result.errors),
                 'timestamp': datetime.now().isoformat()
             })
             
@@ -450,4 +647,4 @@ class FeedbackLoop:
     
     def get_history(self) -> List[Dict[str, Any]]:
         """이력 반환"""
-        return self.iteration_history
+        return list(self.iteration_history)
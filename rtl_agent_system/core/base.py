@@ -2,11 +2,41 @@
 RTL Agent System - Base Classes and Interfaces
 """
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Union
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, List, Mapping, Optional, Tuple, Union
 from dataclasses import dataclass, field
 from enum import Enum
 import json
+import sys
+import time
 from datetime import datetime
+from types import MappingProxyType
+
+try:
+    # 선택 의존성: orjson (C 구현 JSON 인코더) - 대형 그래프 저장용
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def thaw_attributes(value: Any) -> Any:
+    """
+    노드 간 공유되는 불변 속성(MappingProxyType/tuple)을 dict/list로 복원 (직렬화용)
+    
+    중첩된 값도 재귀적으로 변환하며, 반환값은 원본과 공유되지 않는 새 객체
+    """
+    if isinstance(value, (dict, MappingProxyType)):
+        return {key: thaw_attributes(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [thaw_attributes(item) for item in value]
+    return value
+
+
+def json_default(obj: Any) -> Any:
+    """orjson default 훅: 공유 불변 속성(MappingProxyType)을 dict로 변환"""
+    if isinstance(obj, MappingProxyType):
+        return dict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
 
 
 class TaskType(Enum):
@@ -28,7 +58,7 @@ class TaskStatus(Enum):
     NEEDS_REVIEW = "needs_review"
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     """작업 데이터 구조"""
     task_id: str
@@ -42,23 +72,53 @@ class Task:
     created_at: datetime = field(default_factory=datetime.now)
     metadata: Dict[str, Any] = field(default_factory=dict)
     
-    def to_dict(self) -> Dict[str, Any]:
-        """딕셔너리로 변환"""
-        return {
+    def to_dict(self, exclude_empty: bool = False) -> Dict[str, Any]:
+        """
+        딕셔너리로 변환 (하위 작업 트리는 재귀 없이 명시적 스택으로 순회)
+        
+        Args:
+            exclude_empty: True이면 비어 있는 context/results/sub_tasks/metadata 키 생략
+        """
+        root = self._shallow_dict(exclude_empty)
+        stack = [(self, root)]
+        while stack:
+            task, data = stack.pop()
+            if not task.sub_tasks:  # 리프 작업은 순회할 것이 없음
+                continue
+            data['sub_tasks'] = children = [
+                st._shallow_dict(exclude_empty) for st in task.sub_tasks
+            ]
+            stack.extend(zip(task.sub_tasks, children))
+        return root
+    
+    def _shallow_dict(self, exclude_empty: bool = False) -> Dict[str, Any]:
+        """하위 작업을 제외한 필드만 딕셔너리로 변환"""
+        data = {
             'task_id': self.task_id,
-            'task_type': self.task_type.value,
+            # Enum.value 프로퍼티 대신 멤버의 _value_ 속성을 직접 읽음
+            'task_type': self.task_type._value_,
             'description': self.description,
-            'status': self.status.value,
+            'status': self.status._value_,
             'priority': self.priority,
             'context': self.context,
             'results': self.results,
-            'sub_tasks': [st.to_dict() for st in self.sub_tasks],
+            'sub_tasks': [],
             'created_at': self.created_at.isoformat(),
             'metadata': self.metadata
         }
+        
+        if exclude_empty:
+            for key, value in (('context', self.context),
+                               ('results', self.results),
+                               ('sub_tasks', self.sub_tasks),
+                               ('metadata', self.metadata)):
+                if not value:
+                    del data[key]
+        
+        return data
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionPlan:
     """실행 계획"""
     plan_id: str
@@ -67,8 +127,52 @@ class ExecutionPlan:
     estimated_duration: Optional[int] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
     
+    # 의존성 역방향 인덱스 (생성 시 한 번 구축)
+    _tasks_by_id: Dict[str, Task] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _successors: Dict[str, List[str]] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _indegree: Dict[str, int] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _remaining: Dict[str, int] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _ranks: Dict[str, int] = field(default_factory=dict, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self._build_index()
+    
+    def _build_index(self):
+        """후속 작업 목록, 진입 차수, 크리티컬 패스 rank 구축"""
+        self._tasks_by_id = {task.task_id: task for task in self.tasks}
+        self._successors = {task_id: [] for task_id in self._tasks_by_id}
+        self._indegree = {}
+        for task_id in self._tasks_by_id:
+            deps = self.dependencies.get(task_id, [])
+            self._indegree[task_id] = len(deps)
+            for dep in deps:
+                if dep in self._successors:
+                    self._successors[dep].append(task_id)
+        self._remaining = dict(self._indegree)
+        
+        # Kahn 알고리즘으로 위상 정렬 후 역순으로 rank = 1 + max(후속 rank)
+        indegree = dict(self._indegree)
+        topo_order = [task_id for task_id, count in indegree.items() if count == 0]
+        for task_id in topo_order:
+            for succ_id in self._successors[task_id]:
+                indegree[succ_id] -= 1
+                if indegree[succ_id] == 0:
+                    topo_order.append(succ_id)
+        
+        self._ranks = {task_id: 1 for task_id in self._tasks_by_id}
+        for task_id in reversed(topo_order):
+            self._ranks[task_id] = 1 + max(
+                (self._ranks[succ_id] for succ_id in self._successors[task_id]),
+                default=0
+            )
+    
     def get_next_tasks(self, completed_task_ids: set) -> List[Task]:
-        """다음 실행 가능한 작업들 반환"""
+        """
+        다음 실행 가능한 작업들 반환
+        
+        호출마다 전체 작업/의존성을 다시 확인하는 O(N+E) 조회이므로,
+        스케줄링 루프에서는 reset_progress/mark_done (in-degree 카운터)를 사용
+        """
         next_tasks = []
         for task in self.tasks:
             if task.task_id in completed_task_ids:
@@ -77,9 +181,30 @@ class ExecutionPlan:
             if all(dep in completed_task_ids for dep in deps):
                 next_tasks.append(task)
         return next_tasks
+    
+    def reset_progress(self) -> List[Task]:
+        """진행 상태 초기화 후 바로 실행 가능한 작업들 반환"""
+        self._remaining = dict(self._indegree)
+        return [
+            self._tasks_by_id[task_id]
+            for task_id, count in self._remaining.items() if count == 0
+        ]
+    
+    def mark_done(self, task_id: str) -> List[Task]:
+        """작업 완료 처리 - 새로 실행 가능해진 후속 작업들 반환"""
+        ready = []
+        for succ_id in self._successors.get(task_id, []):
+            self._remaining[succ_id] -= 1
+            if self._remaining[succ_id] == 0:
+                ready.append(self._tasks_by_id[succ_id])
+        return ready
+    
+    def get_rank(self, task_id: str) -> int:
+        """크리티컬 패스 우선순위 (후속 체인 길이)"""
+        return self._ranks.get(task_id, 1)
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisResult:
     """분석 결과"""
     success: bool
@@ -89,6 +214,22 @@ class AnalysisResult:
     warnings: List[str] = field(default_factory=list)
     recommendations: List[str] = field(default_factory=list)
     timestamp: datetime = field(default_factory=datetime.now)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """딕셔너리로 변환 (details에 담긴 하위 AnalysisResult 리스트도 변환)"""
+        return {
+            'success': self.success,
+            'summary': self.summary,
+            'details': {
+                key: [item.to_dict() if isinstance(item, AnalysisResult) else item
+                      for item in value] if isinstance(value, list) else value
+                for key, value in self.details.items()
+            },
+            'errors': self.errors,
+            'warnings': self.warnings,
+            'recommendations': self.recommendations,
+            'timestamp': self.timestamp.isoformat()
+        }
 
 
 class Agent(ABC):
@@ -97,7 +238,22 @@ class Agent(ABC):
     def __init__(self, name: str, config: Optional[Dict[str, Any]] = None):
         self.name = name
         self.config = config or {}
-        self.history: List[Dict[str, Any]] = []
+        # 액션 이력: (time.time(), action, details)를 최근 history_max개까지 유지
+        self._history: Deque[Tuple[float, str, Dict[str, Any]]] = deque(
+            maxlen=self.config.get('history_max', 10000)
+        )
+    
+    @property
+    def history(self) -> List[Dict[str, Any]]:
+        """액션 이력 (timestamp 문자열은 조회 시점에 변환)"""
+        return [
+            {
+                'timestamp': datetime.fromtimestamp(ts).isoformat(),
+                'action': action,
+                'details': details
+            }
+            for ts, action, details in self._history
+        ]
     
     @abstractmethod
     async def process(self, task: Task) -> AnalysisResult:
@@ -106,11 +262,7 @@ class Agent(ABC):
     
     def log_action(self, action: str, details: Dict[str, Any]):
         """액션 로깅"""
-        self.history.append({
-            'timestamp': datetime.now().isoformat(),
-            'action': action,
-            'details': details
-        })
+        self._history.append((time.time(), action, details))
 
 
 class KnowledgeStore(ABC):
@@ -154,31 +306,43 @@ class ToolExecutor(ABC):
         pass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GraphNode:
     """그래프 노드"""
     node_id: str
     node_type: str  # module, signal, instance, etc.
     name: str
-    attributes: Dict[str, Any] = field(default_factory=dict)
+    # 여러 노드가 공유하는 속성은 읽기 전용 MappingProxyType (값의 리스트는 tuple)
+    attributes: Mapping[str, Any] = field(default_factory=dict)
+    
+    def __post_init__(self):
+        # 반복되는 ID/타입 문자열을 intern하여 엣지의 source/target과 객체를 공유
+        # (frozen이므로 object.__setattr__ 사용)
+        object.__setattr__(self, 'node_id', sys.intern(self.node_id))
+        object.__setattr__(self, 'node_type', sys.intern(self.node_type))
     
     def to_dict(self) -> Dict[str, Any]:
         return {
             'node_id': self.node_id,
             'node_type': self.node_type,
             'name': self.name,
-            'attributes': self.attributes
+            'attributes': thaw_attributes(self.attributes)
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GraphEdge:
     """그래프 엣지"""
     edge_id: str
     source: str  # node_id
     target: str  # node_id
     edge_type: str  # connection, hierarchy, dependency, etc.
-    attributes: Dict[str, Any] = field(default_factory=dict)
+    attributes: Mapping[str, Any] = field(default_factory=dict)
+    
+    def __post_init__(self):
+        object.__setattr__(self, 'source', sys.intern(self.source))
+        object.__setattr__(self, 'target', sys.intern(self.target))
+        object.__setattr__(self, 'edge_type', sys.intern(self.edge_type))
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -186,7 +350,7 @@ class GraphEdge:
             'source': self.source,
             'target': self.target,
             'edge_type': self.edge_type,
-            'attributes': self.attributes
+            'attributes': thaw_attributes(self.attributes)
         }
 
 
@@ -197,58 +361,180 @@ class Graph:
         self.nodes: Dict[str, GraphNode] = {}
         self.edges: Dict[str, GraphEdge] = {}
         self.adjacency: Dict[str, List[str]] = {}  # node_id -> [connected_node_ids]
+        self.edge_index: Dict[Tuple[str, str], List[str]] = {}  # (source, target) -> [edge_ids]
+        self._dict_cache: Optional[Dict[str, Any]] = None  # to_dict() 결과 (변경 시 무효화)
+        # (source, edge_type) -> [edges], 첫 조회 시 생성 (변경 시 무효화)
+        self._out_edge_cache: Optional[Dict[Tuple[str, str], List[GraphEdge]]] = None
+        self.version = 0  # 노드/엣지가 추가될 때마다 증가 (외부 캐시 무효화용)
     
     def add_node(self, node: GraphNode):
         """노드 추가"""
+        self.version += 1
+        self._dict_cache = None
         self.nodes[node.node_id] = node
         if node.node_id not in self.adjacency:
             self.adjacency[node.node_id] = []
     
     def add_edge(self, edge: GraphEdge):
         """엣지 추가"""
+        self.version += 1
+        self._dict_cache = None
+        self._out_edge_cache = None
+        previous = self.edges.get(edge.edge_id)
         self.edges[edge.edge_id] = edge
+        
+        key = (edge.source, edge.target)
+        if previous is None:
+            self.edge_index.setdefault(key, []).append(edge.edge_id)
+        elif (previous.source, previous.target) != key:
+            # 같은 ID의 엣지가 다른 노드 쌍으로 재정의된 경우 (드묾):
+            # 인덱스 순서를 self.edges 순서와 맞추기 위해 해당 키만 재구성
+            self.edge_index[(previous.source, previous.target)].remove(edge.edge_id)
+            self.edge_index[key] = [
+                edge_id for edge_id, e in self.edges.items()
+                if (e.source, e.target) == key
+            ]
         if edge.source not in self.adjacency:
             self.adjacency[edge.source] = []
         if edge.target not in self.adjacency:
             self.adjacency[edge.target] = []
         self.adjacency[edge.source].append(edge.target)
     
+    def add_nodes_bulk(self, nodes: Iterable[GraphNode]):
+        """노드 일괄 추가 (add_node 반복과 동일한 결과, 딕셔너리는 배치 단위로 갱신)"""
+        batch = {node.node_id: node for node in nodes}
+        self.version += 1
+        self._dict_cache = None
+        self.nodes.update(batch)
+        adjacency = self.adjacency
+        if adjacency:
+            for node_id in batch:
+                if node_id not in adjacency:
+                    adjacency[node_id] = []
+        else:
+            self.adjacency = {node_id: [] for node_id in batch}
+    
+    def add_edges_bulk(self, edges: Iterable[GraphEdge]):
+        """엣지 일괄 추가 (add_edge 반복과 동일한 결과)"""
+        batch = list(edges)
+        new_edges = {edge.edge_id: edge for edge in batch}
+        if len(new_edges) != len(batch) or not self.edges.keys().isdisjoint(new_edges):
+            # 엣지 ID 재정의가 섞인 배치는 add_edge의 재정의 처리를 그대로 사용
+            for edge in batch:
+                self.add_edge(edge)
+            return
+        
+        self.version += 1
+        self._dict_cache = None
+        self._out_edge_cache = None
+        self.edges.update(new_edges)
+        adjacency = self.adjacency
+        edge_index = self.edge_index
+        for edge in batch:
+            source = edge.source
+            target = edge.target
+            
+            edge_ids = edge_index.get((source, target))
+            if edge_ids is None:
+                edge_index[(source, target)] = [edge.edge_id]
+            else:
+                edge_ids.append(edge.edge_id)
+            
+            targets = adjacency.get(source)
+            if targets is None:
+                targets = adjacency[source] = []
+            if target not in adjacency:
+                adjacency[target] = []
+            targets.append(target)
+    
     def get_neighbors(self, node_id: str) -> List[GraphNode]:
         """이웃 노드 반환"""
         neighbor_ids = self.adjacency.get(node_id, [])
         return [self.nodes[nid] for nid in neighbor_ids if nid in self.nodes]
     
+    def get_out_edges(self, node_id: str, edge_type: str) -> List[GraphEdge]:
+        """node_id에서 나가는 edge_type 엣지 목록 (self.edges 순서)"""
+        index = self._out_edge_cache
+        if index is None:
+            index = {}
+            for edge in self.edges.values():
+                key = (edge.source, edge.edge_type)
+                edges = index.get(key)
+                if edges is None:
+                    index[key] = [edge]
+                else:
+                    edges.append(edge)
+            self._out_edge_cache = index
+        return index.get((node_id, edge_type), [])
+    
     def get_subgraph(self, node_ids: List[str], depth: int = 1) -> 'Graph':
         """서브그래프 추출"""
         subgraph = Graph()
         visited = set()
         
-        def traverse(nid: str, current_depth: int):
-            if current_depth > depth or nid in visited or nid not in self.nodes:
-                return
-            visited.add(nid)
-            subgraph.add_node(self.nodes[nid])
-            
-            for neighbor_id in self.adjacency.get(nid, []):
-                # 엣지 찾기
-                for edge in self.edges.values():
-                    if edge.source == nid and edge.target == neighbor_id:
-                        subgraph.add_edge(edge)
-                traverse(neighbor_id, current_depth + 1)
-        
+        # 재귀 대신 명시적 스택으로 DFS (각 프레임은 이웃 리스트의 진행 위치를 유지)
         for node_id in node_ids:
-            traverse(node_id, 0)
+            if depth < 0 or node_id in visited or node_id not in self.nodes:
+                continue
+            visited.add(node_id)
+            subgraph.add_node(self.nodes[node_id])
+            stack = [(node_id, 0, iter(self.adjacency.get(node_id, [])))]
+            
+            while stack:
+                nid, current_depth, neighbors = stack[-1]
+                neighbor_id = next(neighbors, None)
+                if neighbor_id is None:
+                    stack.pop()
+                    continue
+                
+                # 엣지 찾기 (전체 엣지 스캔 대신 (source, target) 인덱스 조회)
+                for edge_id in self.edge_index.get((nid, neighbor_id), ()):
+                    subgraph.add_edge(self.edges[edge_id])
+                
+                if (current_depth < depth
+                        and neighbor_id not in visited
+                        and neighbor_id in self.nodes):
+                    visited.add(neighbor_id)
+                    subgraph.add_node(self.nodes[neighbor_id])
+                    stack.append((
+                        neighbor_id,
+                        current_depth + 1,
+                        iter(self.adjacency.get(neighbor_id, []))
+                    ))
         
         return subgraph
     
     def to_dict(self) -> Dict[str, Any]:
-        """딕셔너리로 변환"""
-        return {
-            'nodes': [node.to_dict() for node in self.nodes.values()],
-            'edges': [edge.to_dict() for edge in self.edges.values()]
-        }
+        """
+        딕셔너리로 변환
+        
+        결과는 다음 add_node/add_edge 전까지 캐시되어 같은 객체가 반환되므로
+        호출자는 반환값을 수정하지 말 것
+        """
+        if self._dict_cache is None:
+            self._dict_cache = {
+                'nodes': [node.to_dict() for node in self.nodes.values()],
+                'edges': [edge.to_dict() for edge in self.edges.values()]
+            }
+        return self._dict_cache
     
     def save_json(self, filepath: str):
         """JSON으로 저장"""
+        if orjson is not None:
+            # orjson은 dataclass를 필드 순서대로 직접 직렬화하므로
+            # to_dict()로 중간 딕셔너리 트리를 만들지 않음
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(
+                    {
+                        'nodes': list(self.nodes.values()),
+                        'edges': list(self.edges.values())
+                    },
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                    default=json_default
+                ))
+            return
+        
+        # 표준 json은 indent 사용 시 순수 파이썬 인코더로 동작하므로
+        # default() 훅보다 to_dict() 후 한 번에 인코딩하는 쪽이 빠름
         with open(filepath, 'w') as f:
             json.dump(self.to_dict(), f, indent=2)
@@ -2,13 +2,23 @@
 Template Engine - EDA 스크립트 생성
 Jinja2 기반 템플릿 렌더링
 """
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
+from types import CodeType
 from pathlib import Path
 import json
 from jinja2 import Environment, FileSystemLoader, Template
 from datetime import datetime
 
 
+# 컴파일된 템플릿 코드 캐시 최대 항목 수 (초과 시 가장 오래된 항목부터 제거)
+TEMPLATE_CODE_CACHE_SIZE = 256
+
+# (템플릿 이름, 파일 경로, 소스) -> 컴파일된 코드 캐시 (프로세스 내 모든 엔진이 공유)
+# 엔진마다 Environment 옵션과 필터가 같으므로 같은 템플릿은 한 번만 파싱/컴파일
+# (이름/경로는 코드 객체에 기록되어 Template.name과 에러 위치에 쓰이므로 키에 포함)
+_TEMPLATE_CODE_CACHE: Dict[Tuple[str, str, str], CodeType] = {}
+
+
 class TemplateEngine:
     """
     템플릿 엔진 - LLM의 구조화된 출력을 실행 가능한 스크립트로 변환
@@ -25,31 +35,92 @@ class TemplateEngine:
         self.env = Environment(
             loader=FileSystemLoader(str(self.template_dir)),
             trim_blocks=True,
-            lstrip_blocks=True
+            lstrip_blocks=True,
+            cache_size=-1
         )
         
         # 커스텀 필터 등록
         self.env.filters['format_list'] = self._format_list
         self.env.filters['format_path'] = self._format_path
+        self.env.filters['joinlines'] = self._join_lines
         
         # 템플릿 레지스트리
         self.templates: Dict[str, Template] = {}
+        
+        # 특수화 레지스트리: 템플릿 이름 -> (컨텍스트 키, {키 값: 특수화 템플릿 이름})
+        self.specializations: Dict[str, Tuple[str, Dict[str, str]]] = {}
     
-    def register_template(self, name: str, template_content: str):
+    def register_template(self, name: str, template_content: str, persist: bool = True):
         """
         템플릿 등록
         
         Args:
             name: 템플릿 이름
             template_content: 템플릿 내용
+            persist: True이면 템플릿 디렉토리에 .j2 파일로도 저장
         """
         # 파일로 저장
-        template_path = self.template_dir / f"{name}.j2"
-        with open(template_path, 'w') as f:
-            f.write(template_content)
+        if persist:
+            self._write_template_file(name, template_content)
+        
+        self._compile_template(name, template_content)
+    
+    def register_templates(self, items: Dict[str, str], persist: bool = True):
+        """
+        여러 템플릿 일괄 등록
+        
+        Args:
+            items: 템플릿 이름 -> 템플릿 내용
+            persist: True이면 템플릿 디렉토리에 .j2 파일로도 저장
+        """
+        # 파일 쓰기를 먼저 한 번에 끝낸 뒤 컴파일
+        if persist:
+            for name, template_content in items.items():
+                self._write_template_file(name, template_content)
         
-        # 캐시에 로드
-        self.templates[name] = self.env.get_template(f"{name}.j2")
+        for name, template_content in items.items():
+            self._compile_template(name, template_content)
+    
+    def _write_template_file(self, name: str, template_content: str):
+        """템플릿 내용을 .j2 파일로 저장"""
+        (self.template_dir / f"{name}.j2").write_text(template_content)
+    
+    def _compile_template(self, name: str, template_content: str):
+        """템플릿 컴파일 후 레지스트리에 등록"""
+        # 파일을 다시 읽지 않고 소스에서 바로 컴파일 (컴파일 결과는 공유 캐시 사용)
+        template_name = f"{name}.j2"
+        filename = str(self.template_dir / template_name)
+        key = (template_name, filename, template_content)
+        code = _TEMPLATE_CODE_CACHE.get(key)
+        if code is None:
+            code = self.env.compile(template_content, name=template_name, filename=filename)
+            if len(_TEMPLATE_CODE_CACHE) >= TEMPLATE_CODE_CACHE_SIZE:
+                del _TEMPLATE_CODE_CACHE[next(iter(_TEMPLATE_CODE_CACHE))]
+            _TEMPLATE_CODE_CACHE[key] = code
+        
+        self.templates[name] = self.env.template_class.from_code(
+            self.env, code, self.env.make_globals(None)
+        )
+        # 내용이 바뀌었으므로 이전 소스 기준의 특수화는 폐기
+        self.specializations.pop(name, None)
+    
+    def register_specialization(self,
+                                name: str,
+                                key: str,
+                                value: str,
+                                template_content: str):
+        """
+        context[key] == value일 때 name 대신 렌더링할 특수화 템플릿 등록
+        
+        Args:
+            name: 원본 템플릿 이름
+            key: 분기 기준 컨텍스트 키
+            value: 특수화할 키 값
+            template_content: value를 미리 대입해 분기를 제거한 템플릿 내용
+        """
+        specialized = f"{name}_{value}"
+        self.register_template(specialized, template_content, persist=False)
+        self.specializations.setdefault(name, (key, {}))[1][value] = specialized
     
     def render(self, 
                template_name: str, 
@@ -66,7 +137,9 @@ class TemplateEngine:
         Returns:
             렌더링된 스크립트
         """
-        template = self._get_template(template_name)
+        template = self._get_template(
+            self._resolve_specialization(template_name, context)
+        )
         
         # 기본 컨텍스트 추가
         full_context = {
@@ -85,10 +158,22 @@ class TemplateEngine:
         
         return rendered
     
+    def _resolve_specialization(self, name: str, context: Dict[str, Any]) -> str:
+        """컨텍스트 값에 맞는 특수화 템플릿 이름 반환 (없으면 원본 이름)"""
+        spec = self.specializations.get(name)
+        if spec is None:
+            return name
+        key, variants = spec
+        value = context.get(key)
+        if isinstance(value, str):
+            return variants.get(value, name)
+        return name
+    
     def _get_template(self, name: str) -> Template:
         """템플릿 가져오기"""
-        if name in self.templates:
-            return self.templates[name]
+        template = self.templates.get(name)
+        if template is not None:
+            return template
         
         # 파일에서 로드 시도
         try:
@@ -101,12 +186,27 @@ class TemplateEngine:
     @staticmethod
     def _format_list(items: List[Any], separator: str = " ") -> str:
         """리스트를 문자열로 포맷팅"""
+        # 대부분 문자열 리스트이므로 str() 변환 없이 바로 join 시도
+        if isinstance(items, (list, tuple)):
+            try:
+                return separator.join(items)
+            except TypeError:
+                pass
         return separator.join(str(item) for item in items)
     
     @staticmethod
     def _format_path(path: str) -> str:
         """경로 포맷팅 (백슬래시 -> 슬래시)"""
         return path.replace("\\", "/")
+    
+    @staticmethod
+    def _join_lines(paths: List[str], indent: str = "    ") -> str:
+        """경로 리스트를 Makefile 줄 연속(\\) 형식으로 포맷팅 (템플릿 루프 대신 str.join)"""
+        if not paths:
+            return ""
+        return f"\\\n{indent}" + f" \\\n{indent}".join(
+            map(TemplateEngine._format_path, paths)
+        )
 
 
 # 기본 템플릿 정의
@@ -150,6 +250,22 @@ report_constraint > {{ output_dir }}/constraints.rpt
 quit
 """
 
+# analysis_mode 분기 블록과 모드별로 미리 평가한 결과
+# (그 외 모드는 원본 템플릿이 else 분기로 처리)
+_PRIMETIME_MODE_BLOCK = """{% if analysis_mode == "setup" %}
+report_timing -delay max -max_paths {{ max_paths }} -nworst {{ nworst }}
+{% elif analysis_mode == "hold" %}
+report_timing -delay min -max_paths {{ max_paths }} -nworst {{ nworst }}
+{% else %}
+report_timing -max_paths {{ max_paths }} -nworst {{ nworst }}
+{% endif %}
+"""
+
+_PRIMETIME_MODE_REPORTS = {
+    "setup": "report_timing -delay max -max_paths {{ max_paths }} -nworst {{ nworst }}\n",
+    "hold": "report_timing -delay min -max_paths {{ max_paths }} -nworst {{ nworst }}\n",
+}
+
 SPYGLASS_LINT_TEMPLATE = """
 # SpyGlass Lint Analysis Script
 # Generated: {{ timestamp }}
@@ -196,9 +312,7 @@ OUTPUT_DIR = {{ output_dir | format_path }}
 TOOL = {{ tool_name }}
 
 # File lists
-RTL_FILES = {% for file in rtl_files %}\\
-    {{ file | format_path }}{% if not loop.last %} \\{% endif %}
-{% endfor %}
+RTL_FILES = {{ rtl_files | joinlines }}
 
 # Targets
 .PHONY: all clean lint synthesis timing
@@ -290,10 +404,17 @@ def create_default_templates(template_dir: str) -> TemplateEngine:
     engine = TemplateEngine(template_dir)
     
     # 기본 템플릿 등록
-    engine.register_template("primetime_sta", PRIMETIME_STA_TEMPLATE)
-    engine.register_template("spyglass_lint", SPYGLASS_LINT_TEMPLATE)
-    engine.register_template("makefile", MAKEFILE_TEMPLATE)
-    engine.register_template("fusion_compiler", FUSION_COMPILER_TEMPLATE)
+    engine.register_templates({
+        "primetime_sta": PRIMETIME_STA_TEMPLATE,
+        "spyglass_lint": SPYGLASS_LINT_TEMPLATE,
+        "makefile": MAKEFILE_TEMPLATE,
+        "fusion_compiler": FUSION_COMPILER_TEMPLATE,
+    })
+    for mode, report in _PRIMETIME_MODE_REPORTS.items():
+        engine.register_specialization(
+            "primetime_sta", "analysis_mode", mode,
+            PRIMETIME_STA_TEMPLATE.replace(_PRIMETIME_MODE_BLOCK, report)
+        )
     
     return engine
 
@@ -1,9 +1,15 @@
 """
 EDA Tool Executor - 실제 EDA 툴 실행
 """
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, BinaryIO, Tuple
 import asyncio
+import contextlib
+import mmap
+import os
+from concurrent.futures import Executor
+import shutil
 import subprocess
+import tempfile
 from pathlib import Path
 from datetime import datetime
 import re
@@ -11,16 +17,119 @@ import json
 
 from core.base import ToolExecutor, AnalysisResult
 
+try:
+    # 선택 의존성: orjson (C 구현 JSON 인코더) - 실행 이력 저장용
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# 파이프에서 한 번에 읽는 크기 / 로그 파일 쓰기 버퍼 크기
+STREAM_CHUNK_SIZE = 64 * 1024
+LOG_WRITE_BUFFER_SIZE = 1 << 20
+
+# 결과로 반환하는 stdout/stderr의 최대 크기 (전체 출력은 로그 파일에 기록)
+DEFAULT_OUTPUT_TAIL_BYTES = 1 << 20
+
+# 출력 파일 검증용 패턴 (bytes 패턴의 IGNORECASE는 ASCII 대소문자만 비교)
+_ERROR_WORD_RE = re.compile(rb'\berror\b', re.IGNORECASE)
+_WARNING_WORD_RE = re.compile(rb'\bwarning\b', re.IGNORECASE)
+
+
+async def _drain_stream(stream: asyncio.StreamReader,
+                        tail: bytearray,
+                        tail_bytes: int,
+                        sink: Optional[BinaryIO] = None):
+    """스트림을 청크 단위로 읽어 sink에 기록하고 마지막 tail_bytes만 메모리에 보관"""
+    while True:
+        chunk = await stream.read(STREAM_CHUNK_SIZE)
+        if not chunk:
+            break
+        if sink is not None:
+            sink.write(chunk)
+        tail += chunk
+        # 매 청크마다 자르지 않고 두 배를 넘을 때만 잘라 복사 비용을 분할 상환
+        if len(tail) > 2 * tail_bytes:
+            del tail[:len(tail) - tail_bytes]
+    if len(tail) > tail_bytes:
+        del tail[:len(tail) - tail_bytes]
+
+
+def _validate_file(file_path: Path) -> AnalysisResult:
+    """파일 검증 (프로세스 풀에서 실행할 수 있도록 모듈 수준 함수)"""
+    try:
+        # 간단한 검증: 에러/경고 카운트
+        # 파일을 str로 디코딩하지 않고 mmap 위에서 bytes 정규식으로 직접 스캔
+        with open(file_path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if size:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    # findall은 매치마다 bytes 객체를 만들므로 이터레이터로 개수만 셈
+                    error_count = sum(1 for _ in _ERROR_WORD_RE.finditer(mm))
+                    warning_count = sum(1 for _ in _WARNING_WORD_RE.finditer(mm))
+            else:
+                error_count = warning_count = 0
+        
+        return AnalysisResult(
+            success=error_count == 0,
+            summary=f"File validated: {error_count} errors, {warning_count} warnings",
+            details={
+                'file': str(file_path),
+                'size': file_path.stat().st_size,
+                'error_count': error_count,
+                'warning_count': warning_count
+            },
+            errors=[f"Found {error_count} errors in output"],
+            warnings=[f"Found {warning_count} warnings in output"]
+        )
+    
+    except Exception as e:
+        return AnalysisResult(
+            success=False,
+            summary="Failed to read output file",
+            details={'file': str(file_path)},
+            errors=[str(e)]
+        )
+
 
 class EDAToolExecutor(ToolExecutor):
     """
     EDA 툴 실행기 - Synopsys, Cadence 등의 툴 실행
     """
     
-    def __init__(self, config: Optional[Dict[str, Any]] = None):
+    def __init__(self,
+                 config: Optional[Dict[str, Any]] = None,
+                 cpu_pool: Optional[Executor] = None):
+        """
+        Args:
+            config: 실행 설정 (tool_paths, output_tail_bytes 등)
+            cpu_pool: 출력 파일 검증(읽기 + 정규식 스캔)을 넘길 풀
+                      (ProcessPoolExecutor 등, None이면 이벤트 루프에서 직접 실행)
+        """
         self.config = config or {}
         self.tool_paths = self.config.get('tool_paths', {})
-        self.execution_history: List[Dict[str, Any]] = []
+        self.cpu_pool = cpu_pool
+        # 실행 이력: 툴/스크립트/명령어가 같은 실행은 명령어 정보를 하나만 두고 공유하며
+        # 실행마다 달라지는 값만 (command_info, start, end, duration, return_code)로 보관
+        self._command_table: Dict[Tuple[str, str, Tuple[str, ...]], Dict[str, Any]] = {}
+        self._runs: List[Tuple[Dict[str, Any], datetime, datetime, float, int]] = []
+    
+    @property
+    def execution_history(self) -> List[Dict[str, Any]]:
+        """실행 이력 (시각 문자열과 success는 조회 시점에 변환)"""
+        return [
+            {
+                'tool': info['tool'],
+                'script': info['script'],
+                'command': list(info['command']),
+                'start_time': start_time.isoformat(),
+                'end_time': end_time.isoformat(),
+                'duration': duration,
+                'return_code': return_code,
+                'success': return_code == 0
+            }
+            for info, start_time, end_time, duration, return_code in self._runs
+        ]
     
     async def execute(self,
                      tool_name: str,
@@ -51,18 +160,17 @@ class EDAToolExecutor(ToolExecutor):
             end_time = datetime.now()
             duration = (end_time - start_time).total_seconds()
             
-            execution_record = {
-                'tool': tool_name,
-                'script': script_path,
-                'command': command,
-                'start_time': start_time.isoformat(),
-                'end_time': end_time.isoformat(),
-                'duration': duration,
-                'return_code': result['return_code'],
-                'success': result['return_code'] == 0
-            }
-            
-            self.execution_history.append(execution_record)
+            key = (tool_name, script_path, tuple(command))
+            command_info = self._command_table.get(key)
+            if command_info is None:
+                command_info = self._command_table[key] = {
+                    'tool': tool_name,
+                    'script': script_path,
+                    'command': command
+                }
+            self._runs.append(
+                (command_info, start_time, end_time, duration, result['return_code'])
+            )
             
             return {
                 'success': result['return_code'] == 0,
@@ -114,7 +222,12 @@ class EDAToolExecutor(ToolExecutor):
     async def _run_command(self, 
                           command: List[str], 
                           working_dir: Optional[str] = None) -> Dict[str, Any]:
-        """명령어 실행"""
+        """
+        명령어 실행
+        
+        전체 출력은 로그 파일에 기록되고, 반환되는 stdout/stderr는
+        마지막 output_tail_bytes(config) 만큼만 포함
+        """
         
         # 로그 파일 설정
         log_file = None
@@ -124,28 +237,48 @@ class EDAToolExecutor(ToolExecutor):
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             log_file = str(log_dir / f"execution_{timestamp}.log")
         
-        # 프로세스 실행
-        process = await asyncio.create_subprocess_exec(
-            *command,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-            cwd=working_dir
-        )
+        tail_bytes = self.config.get('output_tail_bytes', DEFAULT_OUTPUT_TAIL_BYTES)
+        stdout_tail = bytearray()
+        stderr_tail = bytearray()
         
-        stdout, stderr = await process.communicate()
-        
-        stdout_text = stdout.decode('utf-8', errors='ignore')
-        stderr_text = stderr.decode('utf-8', errors='ignore')
+        # 출력을 메모리에 모으지 않고 청크 단위로 로그 파일에 바로 기록
+        # (stderr는 임시 파일에 모았다가 종료 후 STDERR 섹션으로 붙임)
+        with contextlib.ExitStack() as stack:
+            log = stderr_spool = None
+            if log_file:
+                log = stack.enter_context(
+                    open(log_file, 'wb', buffering=LOG_WRITE_BUFFER_SIZE)
+                )
+                stderr_spool = stack.enter_context(tempfile.TemporaryFile())
+                log.writelines((
+                    b"=== COMMAND ===\n",
+                    " ".join(command).encode('utf-8'),
+                    b"\n\n=== STDOUT ===\n",
+                ))
+            
+            # 프로세스 실행
+            process = await asyncio.create_subprocess_exec(
+                *command,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                cwd=working_dir
+            )
+            
+            await asyncio.gather(
+                _drain_stream(process.stdout, stdout_tail, tail_bytes, log),
+                _drain_stream(process.stderr, stderr_tail, tail_bytes, stderr_spool),
+                process.wait()
+            )
+            
+            if log is not None:
+                log.write(b"\n\n=== STDERR ===\n")
+                stderr_spool.seek(0)
+                # stderr가 클 수 있으므로 복사는 스레드에서 수행
+                await asyncio.to_thread(shutil.copyfileobj, stderr_spool, log)
+                log.write(b"\n")
         
-        # 로그 파일에 저장
-        if log_file:
-            with open(log_file, 'w') as f:
-                f.write("=== COMMAND ===\n")
-                f.write(" ".join(command) + "\n\n")
-                f.write("=== STDOUT ===\n")
-                f.write(stdout_text + "\n\n")
-                f.write("=== STDERR ===\n")
-                f.write(stderr_text + "\n")
+        stdout_text = stdout_tail.decode('utf-8', errors='ignore')
+        stderr_text = stderr_tail.decode('utf-8', errors='ignore')
         
         return {
             'return_code': process.returncode,
@@ -176,6 +309,9 @@ class EDAToolExecutor(ToolExecutor):
         
         # 파일인 경우
         if path.is_file():
+            if self.cpu_pool is not None:
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(self.cpu_pool, _validate_file, path)
             return self._validate_file(path)
         
         # 디렉토리인 경우
@@ -191,45 +327,31 @@ class EDAToolExecutor(ToolExecutor):
     
     def _validate_file(self, file_path: Path) -> AnalysisResult:
         """파일 검증"""
-        try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-            
-            # 간단한 검증: 에러/경고 카운트
-            errors = re.findall(r'\bError\b', content, re.IGNORECASE)
-            warnings = re.findall(r'\bWarning\b', content, re.IGNORECASE)
-            
-            return AnalysisResult(
-                success=len(errors) == 0,
-                summary=f"File validated: {len(errors)} errors, {len(warnings)} warnings",
-                details={
-                    'file': str(file_path),
-                    'size': file_path.stat().st_size,
-                    'error_count': len(errors),
-                    'warning_count': len(warnings)
-                },
-                errors=[f"Found {len(errors)} errors in output"],
-                warnings=[f"Found {len(warnings)} warnings in output"]
-            )
-            
-        except Exception as e:
-            return AnalysisResult(
-                success=False,
-                summary="Failed to read output file",
-                details={'file': str(file_path)},
-                errors=[str(e)]
-            )
+        return _validate_file(file_path)
     
     def _validate_directory(self, dir_path: Path) -> AnalysisResult:
         """디렉토리 검증"""
-        files = list(dir_path.rglob('*'))
+        # 경로 리스트를 만들지 않고 scandir로 하위 항목 수만 센다
+        # (rglob('*')와 동일하게 디렉토리 포함, 심볼릭 링크 디렉토리는 따라가지 않음)
+        file_count = 0
+        stack = [str(dir_path)]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as it:
+                    for entry in it:
+                        file_count += 1
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+            except PermissionError:
+                # rglob과 마찬가지로 읽을 수 없는 디렉토리는 건너뜀
+                continue
         
         return AnalysisResult(
             success=True,
-            summary=f"Directory contains {len(files)} files",
+            summary=f"Directory contains {file_count} files",
             details={
                 'directory': str(dir_path),
-                'file_count': len(files)
+                'file_count': file_count
             }
         )
     
@@ -239,6 +361,11 @@ class EDAToolExecutor(ToolExecutor):
     
     def save_history(self, filepath: str):
         """실행 이력 저장"""
+        if orjson is not None:
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(self.execution_history, option=orjson.OPT_INDENT_2))
+            return
+        
         with open(filepath, 'w') as f:
             json.dump(self.execution_history, f, indent=2)
 
@@ -307,28 +434,47 @@ class ParallelExecutor:
         
         Args:
             jobs: 작업 리스트, 각 작업은 {'tool', 'script', 'args'} 포함
+                  ('output'이 있으면 실행 후 해당 경로를 검증하여 'validation'에 첨부)
         
         Returns:
             결과 리스트
         """
-        tasks = [self._execute_with_semaphore(job) for job in jobs]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # 예외 처리
-        processed_results = []
-        for result in results:
-            if isinstance(result, Exception):
-                processed_results.append({
-                    'success': False,
-                    'error': str(result)
-                })
-            else:
-                processed_results.append(result)
+        results: List[Dict[str, Any]] = [None] * len(jobs)
+        validations: List[Tuple[int, asyncio.Task]] = []
+        # 워커들이 공유하는 작업 이터레이터 (작업마다 코루틴을 만들지 않고
+        # max_concurrent개의 워커가 순서대로 꺼내 실행)
+        pending = iter(enumerate(jobs))
+        
+        async def worker():
+            for index, job in pending:
+                try:
+                    results[index] = await self._execute_with_semaphore(job)
+                except Exception as e:
+                    results[index] = {'success': False, 'error': str(e)}
+                    continue
+                
+                # 검증은 별도 태스크로 넘겨 워커(툴 실행 슬롯)를 점유하지 않음
+                # (EDAToolExecutor에 cpu_pool이 있으면 파일 검증은 풀에서 병렬 처리)
+                output_path = job.get('output')
+                if output_path:
+                    validations.append((index, asyncio.create_task(
+                        self.executor.validate_output(output_path)
+                    )))
+        
+        await asyncio.gather(*[
+            worker() for _ in range(min(self.max_concurrent, len(jobs)))
+        ])
+        
+        for index, validation in validations:
+            try:
+                results[index]['validation'] = await validation
+            except Exception as e:
+                results[index] = {'success': False, 'error': str(e)}
         
-        return processed_results
+        return results
     
     async def _execute_with_semaphore(self, job: Dict[str, Any]) -> Dict[str, Any]:
-        """세마포어를 사용한 실행"""
+        """세마포어를 사용한 실행 (여러 배치가 동시에 돌아도 전체 동시 실행 수 제한)"""
         async with self.semaphore:
             return await self.executor.execute(
                 tool_name=job['tool'],
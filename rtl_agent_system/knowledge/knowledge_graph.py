@@ -2,13 +2,90 @@
 Knowledge Graph - RTL 설계 지식 관리
 모듈 계층, 신호 연결, 의존성을 그래프로 관리
 """
-from typing import Dict, List, Optional, Any, Set
+from typing import Dict, Iterator, List, Mapping, Optional, Any, Set, Tuple
+from concurrent.futures import ProcessPoolExecutor
+import asyncio
+import os
 import re
+import sys
 import json
+import copyreg
+import pickle
 from pathlib import Path
 from dataclasses import dataclass
+from types import MappingProxyType
 
-from core.base import Graph, GraphNode, GraphEdge
+from core.base import Graph, GraphNode, GraphEdge, json_default
+
+try:
+    # 선택 의존성: orjson (C 구현 JSON 인코더/디코더) - 대형 KG 저장/로드용
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# get_module_context 결과 캐시 최대 항목 수
+MODULE_CONTEXT_CACHE_SIZE = 512
+
+# RTL 추출 패턴 (모듈 임포트 시 한 번만 컴파일)
+# module name (...); ... endmodule
+_MODULE_RE = re.compile(
+    r'module\s+(\w+)\s*(?:#\s*\([^)]*\))?\s*\(([^;]*)\);(.*?)endmodule', re.DOTALL
+)
+_PORT_RE = re.compile(r'(input|output|inout)\s+(?:\[[\d:]+\])?\s*(\w+)')
+# 줄 단위 TCL 변수 대입 (명령 시작의 set만 인식) 및 값 끝의 ';# 주석'
+_TCL_SET_RE = re.compile(r'\s*set\s+(\w+)\s+(.+)')
+_TCL_TRAILING_COMMENT_RE = re.compile(r';\s*#')
+
+# 인스턴스의 모듈 타입이 될 수 없는 키워드
+_INSTANCE_KEYWORDS = (
+    'wire', 'reg', 'logic', 'input', 'output', 'inout',
+    'assign', 'always', 'initial', 'generate',
+)
+
+# 모듈 본문 토큰: 신호 선언(wire/reg/logic) 또는 인스턴스(module_type instance_name (...)
+# 키워드는 사후 필터링 대신 부정 전방탐색으로 정규식 안에서 제외하여 본문을 한 번만 스캔
+_BODY_TOKEN_RE = re.compile(
+    r'\b(?P<sig_type>wire|reg|logic)\s+(?:\[[\d:]+\])?\s*(?P<sig_name>\w+)'
+    r'|\b(?!(?:' + '|'.join(_INSTANCE_KEYWORDS) + r')\b)'
+    r'(?P<module_type>\w+)\s+(?:#\s*\([^)]*\))?\s*(?P<instance_name>\w+)\s*\('
+)
+
+
+def _parse_rtl_worker(file_path: str) -> List[Dict[str, Any]]:
+    """워커 프로세스용 RTL 파일 파싱 (그래프 갱신 없이 추출 결과만 반환)"""
+    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+        content = f.read()
+    return DesignKnowledgeGraph()._parse_rtl_content(content)
+
+
+def _freeze_attributes(value: Dict[str, Any]) -> Mapping[str, Any]:
+    """노드 간 공유할 속성 dict를 읽기 전용 뷰로 감쌈"""
+    return MappingProxyType(value)
+
+
+def _reduce_mapping_proxy(proxy: MappingProxyType):
+    """체크포인트 pickle용: 로드 시 내부 dict 사본을 다시 읽기 전용으로 감싸도록 기록"""
+    return _freeze_attributes, (dict(proxy),)
+
+
+def _scan_tcl_variables(file_path: str) -> List[Tuple[str, str]]:
+    """TCL 파일을 한 줄씩 읽으며 (변수명, 값) 목록 추출 (메모리 사용량은 한 줄 크기)"""
+    variables = []
+    with open(file_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            match = _TCL_SET_RE.match(line)
+            if not match:
+                continue
+            value = match.group(2)
+            if ';' in value:
+                comment = _TCL_TRAILING_COMMENT_RE.search(value)
+                if comment:
+                    value = value[:comment.start()]
+            value = value.strip()
+            if value:
+                variables.append((match.group(1), value))
+    return variables
 
 
 class DesignKnowledgeGraph:
@@ -20,6 +97,11 @@ class DesignKnowledgeGraph:
         self.graph = Graph()
         self.file_registry: Dict[str, str] = {}  # file_path -> node_id
         self.module_registry: Dict[str, str] = {}  # module_name -> node_id
+        # 내용이 같은 포트/속성 객체를 하나만 유지 (노드 간 공유, 읽기 전용으로 취급)
+        self._shared_objects: Dict[Tuple, Any] = {}
+        # (module_name, depth) -> 서브그래프, graph.version이 바뀌면 전체 무효화
+        self._context_cache: Dict[Tuple[str, int], Graph] = {}
+        self._context_cache_version = -1
     
     async def parse_rtl_file(self, file_path: str) -> List[GraphNode]:
         """
@@ -31,23 +113,81 @@ class DesignKnowledgeGraph:
         Returns:
             생성된 노드 리스트
         """
-        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-            content = f.read()
+        # 파일 읽기는 스레드로 넘겨 이벤트 루프를 막지 않음
+        content = await asyncio.to_thread(
+            Path(file_path).read_text, encoding='utf-8', errors='ignore'
+        )
         
-        nodes = []
+        return self._add_rtl_modules(self._parse_rtl_content(content), file_path)
+    
+    async def parse_rtl_files(self,
+                              file_paths: List[str],
+                              max_workers: Optional[int] = None) -> List[Any]:
+        """
+        여러 RTL 파일을 프로세스 풀에서 병렬 파싱하여 Knowledge Graph에 추가
+        
+        파싱(정규식 추출)만 워커에서 수행하고, 그래프 갱신은 메인 프로세스에서
+        file_paths 순서대로 수행하므로 결과는 parse_rtl_file을 차례로 호출한 것과 같음
+        
+        Args:
+            file_paths: RTL 파일 경로 리스트
+            max_workers: 최대 프로세스 수 (None이면 CPU 수)
+        
+        Returns:
+            파일별 생성 노드 리스트 (파싱에 실패한 파일은 해당 예외 객체)
+        """
+        max_workers = min(max_workers or os.cpu_count() or 1, len(file_paths))
+        if max_workers <= 1:
+            results = []
+            for file_path in file_paths:
+                try:
+                    results.append(await self.parse_rtl_file(file_path))
+                except Exception as e:
+                    results.append(e)
+            return results
+        
+        loop = asyncio.get_running_loop()
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            parsed = await asyncio.gather(*[
+                loop.run_in_executor(pool, _parse_rtl_worker, file_path)
+                for file_path in file_paths
+            ], return_exceptions=True)
+        
+        return [
+            modules if isinstance(modules, BaseException)
+            else self._add_rtl_modules(modules, file_path)
+            for file_path, modules in zip(file_paths, parsed)
+        ]
+    
+    def _parse_rtl_content(self, content: str) -> List[Dict[str, Any]]:
+        """
+        RTL 소스에서 모듈별 포트/인스턴스/신호 추출 (그래프는 변경하지 않음)
         
-        # 모듈 추출
+        모듈 본문은 추출 후 버려서 워커 프로세스에서 돌려받는 데이터를 줄임
+        """
         modules = self._extract_modules(content)
         for module_info in modules:
+            # 모듈 본문에서 인스턴스와 신호를 한 번에 추출
+            instances, signals = self._extract_body_items(module_info.pop('body'))
+            module_info['instances'] = instances
+            module_info['signals'] = signals
+        return modules
+    
+    def _add_rtl_modules(self, modules: List[Dict[str, Any]], file_path: str) -> List[GraphNode]:
+        """추출된 모듈 정보로 노드/엣지를 생성하여 그래프에 추가"""
+        nodes = []
+        
+        # 모듈 노드 생성 (모듈명은 여러 노드의 속성에 반복되므로 intern)
+        for module_info in modules:
+            module_info['name'] = sys.intern(module_info['name'])
             node = self._create_module_node(module_info, file_path)
             self.graph.add_node(node)
             nodes.append(node)
-            self.module_registry[module_info['name']] = node.node_id
+            self.module_registry[node.name] = node.node_id
         
-        # 모듈 인스턴스 추출 및 계층 관계 생성
+        # 모듈 인스턴스 노드 및 계층 관계 생성
         for module_info in modules:
-            instances = self._extract_instances(module_info['body'])
-            for inst in instances:
+            for inst in module_info['instances']:
                 # 인스턴스 노드 생성
                 inst_node = self._create_instance_node(inst, module_info['name'])
                 self.graph.add_node(inst_node)
@@ -61,14 +201,13 @@ class DesignKnowledgeGraph:
                         source=parent_id,
                         target=inst_node.node_id,
                         edge_type="hierarchy",
-                        attributes={'instance_name': inst['instance_name']}
+                        attributes={'instance_name': inst_node.name}
                     )
                     self.graph.add_edge(edge)
         
-        # 신호 및 포트 추출
+        # 신호 노드 생성
         for module_info in modules:
-            signals = self._extract_signals(module_info['body'])
-            for signal in signals:
+            for signal in module_info['signals']:
                 sig_node = self._create_signal_node(signal, module_info['name'])
                 self.graph.add_node(sig_node)
                 nodes.append(sig_node)
@@ -81,7 +220,7 @@ class DesignKnowledgeGraph:
                         source=module_id,
                         target=sig_node.node_id,
                         edge_type="contains_signal",
-                        attributes={}
+                        attributes=self._shared(('no_attrs',), {})
                     )
                     self.graph.add_edge(edge)
         
@@ -91,9 +230,7 @@ class DesignKnowledgeGraph:
     
     def _extract_modules(self, content: str) -> List[Dict[str, Any]]:
         """모듈 정의 추출"""
-        # module name (...); ... endmodule
-        pattern = r'module\s+(\w+)\s*(?:#\s*\([^)]*\))?\s*\(([^;]*)\);(.*?)endmodule'
-        matches = re.finditer(pattern, content, re.DOTALL)
+        matches = _MODULE_RE.finditer(content)
         
         modules = []
         for match in matches:
@@ -120,7 +257,7 @@ class DesignKnowledgeGraph:
                 continue
             
             # input/output/inout 찾기
-            match = re.search(r'(input|output|inout)\s+(?:\[[\d:]+\])?\s*(\w+)', line)
+            match = _PORT_RE.search(line)
             if match:
                 direction = match.group(1)
                 name = match.group(2)
@@ -128,49 +265,58 @@ class DesignKnowledgeGraph:
         
         return ports
     
-    def _extract_instances(self, body: str) -> List[Dict[str, str]]:
-        """모듈 인스턴스 추출"""
-        # module_type instance_name (...);
-        pattern = r'(\w+)\s+(?:#\s*\([^)]*\))?\s*(\w+)\s*\('
-        matches = re.finditer(pattern, body)
-        
-        instances = []
-        for match in matches:
-            module_type = match.group(1)
-            instance_name = match.group(2)
-            
-            # 키워드 필터링
-            if module_type in ['wire', 'reg', 'logic', 'input', 'output', 'inout', 
-                              'assign', 'always', 'initial', 'generate']:
-                continue
-            
-            instances.append({
-                'module_type': module_type,
-                'instance_name': instance_name
-            })
+    def _share_ports(self, ports: List[Dict[str, str]]) -> Tuple[Mapping[str, str], ...]:
+        """같은 포트와 포트 구성이 같은 목록(래퍼 모듈 등)을 하나의 읽기 전용 객체로 공유"""
+        shared_ports = []
+        for port in ports:
+            direction = port['direction']
+            name = sys.intern(port['name'])
+            shared_ports.append(self._shared(
+                ('port', direction, name), {'direction': direction, 'name': name}
+            ))
+        shared_ports = tuple(shared_ports)
+        return self._shared_objects.setdefault(
+            ('ports',) + tuple(map(id, shared_ports)), shared_ports
+        )
+    
+    def _shared(self, key: Tuple, value: Dict[str, Any]) -> Mapping[str, Any]:
+        """
+        key에 해당하는 공유 속성 반환 (없으면 value를 읽기 전용으로 감싸 등록)
         
-        return instances
+        여러 노드가 같은 객체를 참조하므로 한 노드를 통한 수정이 다른 노드에
+        번지지 않도록 MappingProxyType으로 공유
+        """
+        shared = self._shared_objects.get(key)
+        if shared is None:
+            shared = self._shared_objects[key] = _freeze_attributes(value)
+        return shared
     
-    def _extract_signals(self, body: str) -> List[Dict[str, str]]:
-        """신호 선언 추출"""
+    def _extract_body_items(self, body: str) -> Tuple[List[Dict[str, str]], List[Dict[str, str]]]:
+        """모듈 본문에서 인스턴스와 신호 선언을 한 번의 스캔으로 추출"""
+        instances = []
         signals = []
         
-        # wire, reg, logic 선언
-        patterns = [
-            r'(wire|reg|logic)\s+(?:\[[\d:]+\])?\s*(\w+)',
-        ]
-        
-        for pattern in patterns:
-            matches = re.finditer(pattern, body)
-            for match in matches:
-                sig_type = match.group(1)
-                sig_name = match.group(2)
+        for match in _BODY_TOKEN_RE.finditer(body):
+            if match.lastgroup == 'sig_name':
                 signals.append({
-                    'type': sig_type,
-                    'name': sig_name
+                    'type': match.group('sig_type'),
+                    'name': match.group('sig_name')
+                })
+            else:
+                instances.append({
+                    'module_type': match.group('module_type'),
+                    'instance_name': match.group('instance_name')
                 })
         
-        return signals
+        return instances, signals
+    
+    def _extract_instances(self, body: str) -> List[Dict[str, str]]:
+        """모듈 인스턴스 추출"""
+        return self._extract_body_items(body)[0]
+    
+    def _extract_signals(self, body: str) -> List[Dict[str, str]]:
+        """신호 선언 추출"""
+        return self._extract_body_items(body)[1]
     
     def _create_module_node(self, module_info: Dict, file_path: str) -> GraphNode:
         """모듈 노드 생성"""
@@ -181,21 +327,26 @@ class DesignKnowledgeGraph:
             name=module_info['name'],
             attributes={
                 'file_path': file_path,
-                'ports': module_info['ports']
+                'ports': self._share_ports(module_info['ports'])
             }
         )
     
     def _create_instance_node(self, inst_info: Dict, parent_module: str) -> GraphNode:
         """인스턴스 노드 생성"""
-        node_id = f"inst_{parent_module}_{inst_info['instance_name']}"
+        instance_name = sys.intern(inst_info['instance_name'])
+        module_type = sys.intern(inst_info['module_type'])
+        node_id = f"inst_{parent_module}_{instance_name}"
         return GraphNode(
             node_id=node_id,
             node_type="instance",
-            name=inst_info['instance_name'],
-            attributes={
-                'module_type': inst_info['module_type'],
-                'parent_module': parent_module
-            }
+            name=instance_name,
+            attributes=self._shared(
+                ('instance', module_type, parent_module),
+                {
+                    'module_type': module_type,
+                    'parent_module': parent_module
+                }
+            )
         )
     
     def _create_signal_node(self, signal_info: Dict, module_name: str) -> GraphNode:
@@ -204,30 +355,25 @@ class DesignKnowledgeGraph:
         return GraphNode(
             node_id=node_id,
             node_type="signal",
-            name=signal_info['name'],
-            attributes={
-                'signal_type': signal_info['type'],
-                'module': module_name
-            }
+            name=sys.intern(signal_info['name']),
+            attributes=self._shared(
+                ('signal', signal_info['type'], module_name),
+                {
+                    'signal_type': signal_info['type'],
+                    'module': module_name
+                }
+            )
         )
     
     async def parse_tcl_script(self, file_path: str) -> List[GraphNode]:
         """
         TCL 스크립트를 파싱하여 설정 정보를 KG에 추가
         """
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        variables = await asyncio.to_thread(_scan_tcl_variables, file_path)
         
         nodes = []
         
-        # 변수 추출
-        var_pattern = r'set\s+(\w+)\s+(.+)'
-        matches = re.finditer(var_pattern, content)
-        
-        for match in matches:
-            var_name = match.group(1)
-            var_value = match.group(2).strip()
-            
+        for var_name, var_value in variables:
             node = GraphNode(
                 node_id=f"var_{var_name}",
                 node_type="tcl_variable",
@@ -251,24 +397,35 @@ class DesignKnowledgeGraph:
             depth: 탐색 깊이
         
         Returns:
-            서브그래프
+            서브그래프 (캐시되어 공유될 수 있으므로 수정하지 말 것)
         """
         node_id = self.module_registry.get(module_name)
         if not node_id:
             return Graph()
         
-        return self.graph.get_subgraph([node_id], depth)
+        if self._context_cache_version != self.graph.version:
+            self._context_cache.clear()
+            self._context_cache_version = self.graph.version
+        
+        key = (module_name, depth)
+        subgraph = self._context_cache.get(key)
+        if subgraph is None:
+            subgraph = self.graph.get_subgraph([node_id], depth)
+            if len(self._context_cache) >= MODULE_CONTEXT_CACHE_SIZE:
+                # 가장 오래 전에 추가된 항목부터 제거
+                del self._context_cache[next(iter(self._context_cache))]
+            self._context_cache[key] = subgraph
+        return subgraph
     
-    def find_modules_by_pattern(self, pattern: str) -> List[GraphNode]:
-        """패턴으로 모듈 검색"""
+    def find_modules_by_pattern(self, pattern: str) -> Iterator[GraphNode]:
+        """패턴으로 모듈 검색 (모듈 레지스트리만 순회하는 지연 제너레이터)"""
         regex = re.compile(pattern, re.IGNORECASE)
-        matching_modules = []
-        
-        for node in self.graph.nodes.values():
-            if node.node_type == "module" and regex.search(node.name):
-                matching_modules.append(node)
-        
-        return matching_modules
+        nodes = self.graph.nodes
+        return (
+            nodes[node_id]
+            for name, node_id in self.module_registry.items()
+            if regex.search(name)
+        )
     
     def get_module_hierarchy(self, module_name: str) -> Dict[str, Any]:
         """모듈의 계층 구조 반환"""
@@ -276,29 +433,49 @@ class DesignKnowledgeGraph:
         if not node_id:
             return {}
         
-        def build_hierarchy(nid: str) -> Dict[str, Any]:
-            node = self.graph.nodes.get(nid)
-            if not node:
-                return {}
-            
+        nodes = self.graph.nodes
+        root = nodes.get(node_id)
+        if not root:
+            return {}
+        
+        # 1) 명시적 스택 DFS로 도달 가능한 노드의 후위 순서 계산 (재귀 깊이 제한 없음)
+        postorder: List[str] = []
+        visited = {node_id}
+        stack = [(node_id, iter(self.graph.get_out_edges(node_id, "hierarchy")))]
+        while stack:
+            nid, edges = stack[-1]
+            for edge in edges:
+                target = edge.target
+                if target not in visited and target in nodes:
+                    visited.add(target)
+                    stack.append((target, iter(self.graph.get_out_edges(target, "hierarchy"))))
+                    break
+            else:
+                stack.pop()
+                postorder.append(nid)
+        
+        # 2) 후위 순서로 하위 트리 구성: 공유되는 하위 트리는 한 번만 만들어 재사용하며,
+        #    아직 구성되지 않은 자식은 경로상의 조상(순환)이므로 빈 트리로 끊음
+        subtrees: Dict[str, Dict[str, Any]] = {}
+        for nid in postorder:
             children = []
-            for edge in self.graph.edges.values():
-                if edge.source == nid and edge.edge_type == "hierarchy":
-                    child_node = self.graph.nodes.get(edge.target)
-                    if child_node:
-                        children.append({
-                            'name': child_node.name,
-                            'type': child_node.attributes.get('module_type', ''),
-                            'children': build_hierarchy(edge.target)
-                        })
+            for edge in self.graph.get_out_edges(nid, "hierarchy"):
+                child_node = nodes.get(edge.target)
+                if child_node:
+                    children.append({
+                        'name': child_node.name,
+                        'type': child_node.attributes.get('module_type', ''),
+                        'children': subtrees.get(edge.target, {})
+                    })
             
-            return {
+            node = nodes[nid]
+            subtrees[nid] = {
                 'name': node.name,
                 'type': node.node_type,
                 'children': children
             }
         
-        return build_hierarchy(node_id)
+        return subtrees[node_id]
     
     def analyze_dependencies(self) -> Dict[str, List[str]]:
         """모듈 간 의존성 분석"""
@@ -309,20 +486,42 @@ class DesignKnowledgeGraph:
                 deps = set()
                 
                 # 인스턴스를 통한 의존성
-                for edge in self.graph.edges.values():
-                    if edge.source == node.node_id and edge.edge_type == "hierarchy":
-                        inst_node = self.graph.nodes.get(edge.target)
-                        if inst_node:
-                            module_type = inst_node.attributes.get('module_type')
-                            if module_type:
-                                deps.add(module_type)
+                for edge in self.graph.get_out_edges(node.node_id, "hierarchy"):
+                    inst_node = self.graph.nodes.get(edge.target)
+                    if inst_node:
+                        module_type = inst_node.attributes.get('module_type')
+                        if module_type:
+                            deps.add(module_type)
                 
                 dependencies[node.name] = list(deps)
         
         return dependencies
     
-    def save(self, filepath: str):
-        """KG를 파일로 저장"""
+    def save(self, filepath: str, pretty: bool = True):
+        """
+        KG를 파일로 저장
+        
+        Args:
+            filepath: 저장 경로
+            pretty: True이면 indent=2로 들여쓰기 (False이면 공백 없이 저장)
+        """
+        if orjson is not None:
+            # 노드/엣지 dataclass는 orjson이 직접 직렬화 (중간 딕셔너리 트리 생략)
+            data = {
+                'graph': {
+                    'nodes': list(self.graph.nodes.values()),
+                    'edges': list(self.graph.edges.values())
+                },
+                'file_registry': self.file_registry,
+                'module_registry': self.module_registry
+            }
+            option = orjson.OPT_NON_STR_KEYS
+            if pretty:
+                option |= orjson.OPT_INDENT_2
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(data, option=option, default=json_default))
+            return
+        
         data = {
             'graph': self.graph.to_dict(),
             'file_registry': self.file_registry,
@@ -330,22 +529,67 @@ class DesignKnowledgeGraph:
         }
         
         with open(filepath, 'w') as f:
-            json.dump(data, f, indent=2)
+            if pretty:
+                json.dump(data, f, indent=2)
+            else:
+                json.dump(data, f, separators=(',', ':'))
     
     def load(self, filepath: str):
         """KG를 파일에서 로드"""
-        with open(filepath, 'r') as f:
-            data = json.load(f)
+        if orjson is not None:
+            with open(filepath, 'rb') as f:
+                data = orjson.loads(f.read())
+        else:
+            with open(filepath, 'r') as f:
+                data = json.load(f)
         
         # 그래프 복원
         graph_data = data['graph']
-        for node_data in graph_data['nodes']:
-            node = GraphNode(**node_data)
-            self.graph.add_node(node)
+        self.graph.add_nodes_bulk(
+            GraphNode(**node_data) for node_data in graph_data['nodes']
+        )
+        self.graph.add_edges_bulk(
+            GraphEdge(**edge_data) for edge_data in graph_data['edges']
+        )
+        
+        self.file_registry = data['file_registry']
+        self.module_registry = data['module_registry']
+    
+    def save_checkpoint(self, filepath: str):
+        """
+        KG 체크포인트를 pickle로 저장 (내부 복구용, 외부 공유/내보내기는 save 사용)
+        
+        JSON보다 빠르고 노드 간 공유되는 속성 객체도 그대로 유지됨
+        """
+        # slots dataclass는 pickle 시 파이썬 수준 __getstate__를 거치므로 필드 튜플로 저장
+        data = {
+            'nodes': [
+                (n.node_id, n.node_type, n.name, n.attributes)
+                for n in self.graph.nodes.values()
+            ],
+            'edges': [
+                (e.edge_id, e.source, e.target, e.edge_type, e.attributes)
+                for e in self.graph.edges.values()
+            ],
+            'file_registry': self.file_registry,
+            'module_registry': self.module_registry
+        }
+        
+        with open(filepath, 'wb') as f:
+            pickler = pickle.Pickler(f, protocol=pickle.HIGHEST_PROTOCOL)
+            # 공유 속성(MappingProxyType)은 기본적으로 pickle할 수 없으므로 이 Pickler에서만
+            # 복원 방법을 등록 (같은 객체는 memo로 한 번만 저장되어 공유가 유지됨)
+            pickler.dispatch_table = copyreg.dispatch_table.copy()
+            pickler.dispatch_table[MappingProxyType] = _reduce_mapping_proxy
+            pickler.dump(data)
+    
+    def load_checkpoint(self, filepath: str):
+        """save_checkpoint로 저장한 KG 로드"""
+        with open(filepath, 'rb') as f:
+            data = pickle.load(f)
         
-        for edge_data in graph_data['edges']:
-            edge = GraphEdge(**edge_data)
-            self.graph.add_edge(edge)
+        self.graph.add_nodes_bulk(GraphNode(*fields) for fields in data['nodes'])
+        self.graph.add_edges_bulk(GraphEdge(*fields) for fields in data['edges'])
         
         self.file_registry = data['file_registry']
         self.module_registry = data['module_registry']
@@ -2,21 +2,64 @@
 RAG Engine - Retrieval Augmented Generation
 EDA 툴 매뉴얼, 과거 프로젝트 지식 검색
 """
-from typing import List, Dict, Optional, Any, Tuple
+from typing import List, Dict, Optional, Any, Set, Tuple
+import asyncio
+import os
 import numpy as np
 from pathlib import Path
 import json
 import pickle
-from dataclasses import dataclass
+import re
+from dataclasses import dataclass, replace
 from datetime import datetime
 import hashlib
 
 from core.base import KnowledgeStore
 
+try:
+    # 선택 의존성: simsimd (SIMD 커널 기반 벡터 유사도) - 대형 저장소 검색용
+    import simsimd
+except ImportError:
+    simsimd = None
+
+try:
+    # 선택 의존성: hnswlib (HNSW 근사 최근접 이웃 색인) - 대규모 저장소 검색용
+    import hnswlib
+except ImportError:
+    hnswlib = None
+
+
+# 임베딩 저장/유사도 계산 자료형 (float32: float64 대비 메모리 대역폭 절반)
+EMBEDDING_DTYPE = np.float32
+
+# int8 양자화 검색 시 float32로 재채점할 후보 수 (limit의 배수)
+QUANTIZED_RERANK_FACTOR = 4
+
+# 근사 최근접 이웃(HNSW) 색인을 사용하기 시작하는 최소 문서 수 (미만이면 전수 검색)
+ANN_MIN_DOCUMENTS = 1024
+
+# HNSW 검색 시 탐색 후보 리스트 크기 (클수록 재현율↑, 속도↓)
+ANN_EF_SEARCH = 128
+
+# 내용 해시 기준 임베딩 캐시 최대 항목 수 (768차원 float32 기준 항목당 3KB)
+EMBEDDING_CACHE_SIZE = 4096
+
+# 검색 쿼리 문자열 기준 정규화된 쿼리 임베딩 캐시 최대 항목 수
+QUERY_CACHE_SIZE = 1024
+
+# 에러 키워드 추출 패턴 (모듈 임포트 시 한 번만 컴파일)
+_ERROR_CODE_RE = re.compile(r'[A-Z]+-\d+')
+_CAPITALIZED_WORD_RE = re.compile(r'\b[A-Z][a-z]+\b')
+
 
 @dataclass
 class Document:
-    """문서 데이터 구조"""
+    """
+    문서 데이터 구조
+    
+    embedding은 저장 시 입력용으로만 사용하며, 저장된 문서의 벡터는
+    VectorStore의 임베딩 행렬에만 보관 (VectorStore.get_embedding으로 조회)
+    """
     doc_id: str
     content: str
     metadata: Dict[str, Any]
@@ -37,11 +80,41 @@ class VectorStore(KnowledgeStore):
     실제 환경에서는 Chroma, Pinecone, Weaviate 등 사용 가능
     """
     
-    def __init__(self, dimension: int = 768):
+    def __init__(self, dimension: int = 768, quantize: bool = False, ann: bool = False):
+        """
+        Args:
+            dimension: 임베딩 차원
+            quantize: int8 양자화 행렬로 후보를 고른 뒤 float32로 재채점 (simsimd 필요)
+            ann: 필터 없는 검색에 HNSW 근사 색인으로 후보를 고른 뒤 float32로 재채점
+                 (hnswlib 필요, ANN_MIN_DOCUMENTS 이상일 때만 사용)
+        """
         self.dimension = dimension
         self.documents: Dict[str, Document] = {}
-        self.embeddings: Optional[np.ndarray] = None
         self.doc_ids: List[str] = []
+        # 임베딩 행렬은 용량을 두 배씩 늘리는 버퍼에 행 단위로 추가
+        # (self.embeddings는 유효한 행 [:_size]만 가리키는 뷰)
+        self._index_of: Dict[str, int] = {}  # doc_id -> 행 번호
+        self._embedding_buffer = np.empty((0, dimension), dtype=EMBEDDING_DTYPE)
+        self._size = 0
+        self.embeddings: np.ndarray = self._embedding_buffer[:0]
+        # 중복 청크/반복 쿼리용 임베딩 캐시 (내용 해시 -> 정규화 전 벡터, FIFO)
+        self._embedding_cache: Dict[bytes, np.ndarray] = {}
+        # 반복 검색용 쿼리 임베딩 캐시 (쿼리 문자열 -> 정규화된 읽기 전용 벡터, FIFO)
+        self._query_cache: Dict[str, np.ndarray] = {}
+        # 메타데이터 역색인 (키 -> 값 -> doc_id 집합), 필터 검색용
+        self._metadata_index: Dict[str, Dict[Any, Set[str]]] = {}
+        # int8 양자화 행렬 (행별 스케일), 앞쪽 _quantized_rows 행만 유효하며 검색 시 갱신
+        self.quantize = quantize and simsimd is not None
+        self._quantized_buffer: Optional[np.ndarray] = None
+        self._scale_buffer: Optional[np.ndarray] = None
+        self._quantized_rows = 0
+        # HNSW 색인 (첫 근사 검색 시 생성), 라벨은 행 번호가 아닌 문서별 고정 번호
+        self.ann = ann and hnswlib is not None
+        self._ann_index = None
+        self._ann_label_of: Dict[str, int] = {}
+        self._ann_doc_ids: Dict[int, str] = {}  # 라벨 -> doc_id
+        self._ann_pending: Dict[str, None] = {}  # 마지막 동기화 이후 추가/변경된 문서 (순서 유지)
+        self._ann_next_label = 0
     
     async def store(self, key: str, value: Any, metadata: Optional[Dict] = None):
         """문서 저장"""
@@ -50,36 +123,111 @@ class VectorStore(KnowledgeStore):
             doc = Document(
                 doc_id=key,
                 content=value,
-                metadata=metadata or {},
-                embedding=self._compute_embedding(value)
+                metadata=metadata or {}
             )
+            embedding = self._compute_embedding(value)
         elif isinstance(value, Document):
-            doc = value
-            if doc.embedding is None:
-                doc.embedding = self._compute_embedding(doc.content)
+            embedding = value.embedding
+            if embedding is None:
+                embedding = self._compute_embedding(value.content)
+            else:
+                # 외부에서 계산된 벡터도 단위 벡터로 맞춰 내적 = 코사인 유사도 유지
+                embedding = self._normalize_rows(
+                    np.array(embedding, dtype=EMBEDDING_DTYPE, ndmin=2)
+                )[0]
+            # 벡터는 임베딩 행렬에만 보관 (호출자의 Document는 변경하지 않고 사본 저장)
+            doc = replace(value, embedding=None)
         else:
             raise ValueError("Value must be string or Document")
         
+        if key in self.documents:
+            self._unindex_metadata(key, self.documents[key].metadata)
         self.documents[key] = doc
-        self._rebuild_index()
+        self._index_metadata(key, doc.metadata)
+        self._append_embedding(key, embedding)
+        self.embeddings = self._embedding_buffer[:self._size]
+    
+    async def store_batch(self,
+                          keys: List[str],
+                          values: List[str],
+                          metadatas: Optional[List[Dict]] = None):
+        """여러 문서를 한 번에 저장 (임베딩 일괄 계산)"""
+        embeddings = self._compute_embeddings_batch(values)
+        self._reserve(self._size + len(keys))
+        
+        for i, (key, value) in enumerate(zip(keys, values)):
+            if key in self.documents:
+                self._unindex_metadata(key, self.documents[key].metadata)
+            doc = Document(
+                doc_id=key,
+                content=value,
+                metadata=metadatas[i] if metadatas else {}
+            )
+            self.documents[key] = doc
+            self._index_metadata(key, doc.metadata)
+            self._append_embedding(key, embeddings[i])
+        
+        self.embeddings = self._embedding_buffer[:self._size]
     
     async def retrieve(self, key: str) -> Optional[Document]:
         """문서 검색"""
         return self.documents.get(key)
     
-    async def search(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
-        """유사도 기반 검색"""
+    def get_embedding(self, key: str) -> Optional[np.ndarray]:
+        """저장된 문서의 임베딩 (임베딩 행렬 행의 뷰)"""
+        idx = self._index_of.get(key)
+        if idx is None:
+            return None
+        return self.embeddings[idx]
+    
+    async def search(self,
+                     query: str,
+                     limit: int = 10,
+                     filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """
+        유사도 기반 검색
+        
+        Args:
+            query: 검색 쿼리
+            limit: 결과 개수
+            filters: 메타데이터 필터 (모든 키/값이 일치하는 문서만 후보로 사용)
+        """
         if not self.documents:
             return []
         
-        query_embedding = self._compute_embedding(query)
-        similarities = self._compute_similarities(query_embedding)
+        query_embedding = self._query_embedding(query)
         
-        # Top-K 인덱스
-        top_indices = np.argsort(similarities)[::-1][:limit]
+        # 필터가 있으면 역색인으로 구한 행만 후보로 사용
+        rows = self._filter_rows(filters) if filters else None
+        
+        if self.ann and rows is None and self._size >= ANN_MIN_DOCUMENTS:
+            # HNSW 색인으로 후보를 고른 뒤 후보 행만 float32로 정확히 재채점
+            rows = self._ann_candidates(query_embedding, max(limit, 0))
+            scores = self._compute_similarities(query_embedding, rows)
+        elif self.quantize:
+            # int8 근사 점수로 후보를 좁힌 뒤 후보 행만 float32로 정확히 재채점
+            rows = self._quantized_candidates(
+                query_embedding, rows, max(limit, 0) * QUANTIZED_RERANK_FACTOR
+            )
+            scores = self._compute_similarities(query_embedding, rows)
+        else:
+            scores = self._compute_similarities(query_embedding)
+            if rows is not None:
+                scores = scores[rows]
+        
+        # Top-K 인덱스: 전체 정렬 대신 argpartition으로 K개만 선택한 뒤 그 K개만 정렬
+        k = min(limit, scores.shape[0])
+        if k <= 0:
+            return []
+        if k < scores.shape[0]:
+            candidates = np.argpartition(-scores, k - 1)[:k]
+        else:
+            candidates = np.arange(scores.shape[0])
+        top_positions = candidates[np.argsort(-scores[candidates])]
         
         results = []
-        for idx in top_indices:
+        for pos in top_positions:
+            idx = rows[pos] if rows is not None else pos
             if idx >= len(self.doc_ids):
                 continue
             doc_id = self.doc_ids[idx]
@@ -88,7 +236,7 @@ class VectorStore(KnowledgeStore):
                 'doc_id': doc_id,
                 'content': doc.content,
                 'metadata': doc.metadata,
-                'score': float(similarities[idx])
+                'score': float(scores[pos])
             })
         
         return results
@@ -96,81 +244,393 @@ class VectorStore(KnowledgeStore):
     async def delete(self, key: str):
         """문서 삭제"""
         if key in self.documents:
-            del self.documents[key]
-            self._rebuild_index()
+            self._unindex_metadata(key, self.documents.pop(key).metadata)
+            self._forget_ann(key)
+            self._remove_embedding(key)
     
     def _compute_embedding(self, text: str) -> np.ndarray:
         """
         텍스트 임베딩 생성 (간단한 구현)
         실제로는 sentence-transformers, OpenAI embeddings 등 사용
         """
+        return self._compute_embeddings_batch([text])[0]
+    
+    def _query_embedding(self, query: str) -> np.ndarray:
+        """쿼리 임베딩 (같은 쿼리 문자열은 해시/난수 생성/정규화 없이 캐시에서 반환)"""
+        embedding = self._query_cache.get(query)
+        if embedding is None:
+            embedding = self._compute_embedding(query)
+            embedding.flags.writeable = False
+            if len(self._query_cache) >= QUERY_CACHE_SIZE:
+                del self._query_cache[next(iter(self._query_cache))]
+            self._query_cache[query] = embedding
+        return embedding
+    
+    def _compute_embeddings_batch(self, texts: List[str]) -> np.ndarray:
+        """
+        여러 텍스트의 임베딩을 (N, dimension) 행렬로 한 번에 생성
+        텍스트별 시드의 독립 Generator를 사용하므로 전역 난수 상태를 변경하지 않음
+        """
         # 간단한 TF-IDF 스타일 임베딩 (데모용)
         # 실제 환경에서는 SentenceTransformer 또는 다른 모델 사용
-        hash_val = int(hashlib.md5(text.encode()).hexdigest(), 16)
-        np.random.seed(hash_val % (2**32))
-        embedding = np.random.randn(self.dimension)
-        # 정규화
-        embedding = embedding / (np.linalg.norm(embedding) + 1e-8)
-        return embedding
+        embeddings = np.empty((len(texts), self.dimension), dtype=EMBEDDING_DTYPE)
+        
+        cache = self._embedding_cache
+        
+        for i, text in enumerate(texts):
+            digest = hashlib.blake2b(text.encode(), digest_size=8).digest()
+            cached = cache.get(digest)
+            if cached is not None:
+                embeddings[i] = cached
+                continue
+            
+            rng = np.random.default_rng(int.from_bytes(digest, 'little'))
+            rng.standard_normal(dtype=EMBEDDING_DTYPE, out=embeddings[i])
+            
+            if len(cache) >= EMBEDDING_CACHE_SIZE:
+                del cache[next(iter(cache))]
+            cache[digest] = embeddings[i].copy()
+        
+        return self._normalize_rows(embeddings)
     
-    def _rebuild_index(self):
-        """인덱스 재구축"""
-        if not self.documents:
-            self.embeddings = None
-            self.doc_ids = []
+    @staticmethod
+    def _normalize_rows(embeddings: np.ndarray) -> np.ndarray:
+        """
+        (N, dimension) 행렬의 각 행을 제자리에서 단위 벡터로 정규화
+        einsum으로 행별 제곱합을 구해 np.linalg.norm보다 임시 배열/오버헤드가 적음
+        """
+        norms = np.sqrt(np.einsum('ij,ij->i', embeddings, embeddings))
+        norms += 1e-8
+        np.divide(embeddings, norms[:, None], out=embeddings)
+        return embeddings
+    
+    def _index_metadata(self, doc_id: str, metadata: Dict[str, Any]):
+        """문서 메타데이터를 역색인에 추가 (해시 불가능한 값은 색인하지 않음)"""
+        for key, value in metadata.items():
+            try:
+                self._metadata_index.setdefault(key, {}).setdefault(value, set()).add(doc_id)
+            except TypeError:
+                continue
+    
+    def _unindex_metadata(self, doc_id: str, metadata: Dict[str, Any]):
+        """문서 메타데이터를 역색인에서 제거"""
+        for key, value in metadata.items():
+            try:
+                values = self._metadata_index[key]
+                doc_ids = values[value]
+            except (KeyError, TypeError):
+                continue
+            doc_ids.discard(doc_id)
+            if not doc_ids:
+                del values[value]
+    
+    def _filter_rows(self, filters: Dict[str, Any]) -> np.ndarray:
+        """메타데이터 필터를 모두 만족하는 문서의 행 번호 (오름차순)"""
+        matched: Optional[Set[str]] = None
+        
+        for key, value in filters.items():
+            doc_ids = None
+            if value is not None:
+                try:
+                    doc_ids = self._metadata_index.get(key, {}).get(value, set())
+                except TypeError:
+                    pass
+            if doc_ids is None:
+                # None(키가 없는 문서도 일치)이나 해시 불가능한 값은 역색인 대신 직접 비교
+                doc_ids = {
+                    doc_id for doc_id, doc in self.documents.items()
+                    if doc.metadata.get(key) == value
+                }
+            
+            matched = set(doc_ids) if matched is None else matched & doc_ids
+            if not matched:
+                return np.empty(0, dtype=np.intp)
+        
+        rows = np.fromiter((self._index_of[doc_id] for doc_id in matched),
+                           dtype=np.intp, count=len(matched))
+        rows.sort()
+        return rows
+    
+    def _reserve(self, size: int):
+        """임베딩 버퍼가 size 행을 담을 수 있도록 용량을 두 배씩 확장"""
+        capacity = self._embedding_buffer.shape[0]
+        if size <= capacity:
             return
         
-        self.doc_ids = list(self.documents.keys())
-        embeddings_list = []
+        buffer = np.empty((max(16, capacity * 2, size), self.dimension), dtype=EMBEDDING_DTYPE)
+        buffer[:self._size] = self._embedding_buffer[:self._size]
+        self._embedding_buffer = buffer
+    
+    def _append_embedding(self, key: str, embedding: np.ndarray):
+        """문서 임베딩을 버퍼에 기록 (기존 문서는 같은 행을 덮어씀)"""
+        idx = self._index_of.get(key)
+        if idx is None:
+            idx = self._size
+            self._reserve(idx + 1)
+            self._index_of[key] = idx
+            self.doc_ids.append(key)
+            self._size += 1
+        self._embedding_buffer[idx] = embedding
+        if idx < self._quantized_rows:
+            self._quantize_rows(idx, idx + 1)
+        if self._ann_index is not None:
+            self._ann_pending[key] = None
+    
+    def _remove_embedding(self, key: str):
+        """
+        문서 행 제거 (삭제 시): 마지막 행을 빈 자리로 옮겨 O(dimension)에 처리
         
-        for doc_id in self.doc_ids:
-            doc = self.documents[doc_id]
-            if doc.embedding is None:
-                doc.embedding = self._compute_embedding(doc.content)
-            embeddings_list.append(doc.embedding)
+        행 순서는 documents 순서와 달라질 수 있으며, 저장/로드는 doc_ids 순서를 따름
+        """
+        idx = self._index_of.pop(key)
+        last = self._size - 1
+        if idx != last:
+            moved = self.doc_ids[last]
+            self._embedding_buffer[idx] = self._embedding_buffer[last]
+            self.doc_ids[idx] = moved
+            self._index_of[moved] = idx
+            if idx < self._quantized_rows:
+                self._quantize_rows(idx, idx + 1)
+        
+        self.doc_ids.pop()
+        self._size = last
+        self._quantized_rows = min(self._quantized_rows, last)
+        self.embeddings = self._embedding_buffer[:self._size]
+    
+    def _compute_similarities(self,
+                              query_embedding: np.ndarray,
+                              rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """코사인 유사도 계산 (rows가 주어지면 해당 행만)"""
+        embeddings = self.embeddings if rows is None else self.embeddings[rows]
+        # 코사인 유사도 (쿼리도 같은 float32로 맞춰 단정밀도 BLAS 경로 사용)
+        query_embedding = np.asarray(query_embedding, dtype=EMBEDDING_DTYPE)
+        if simsimd is not None and embeddings.shape[0]:
+            # 행이 모두 정규화되어 있으므로 내적이 곧 코사인 유사도
+            return np.asarray(
+                simsimd.cdist(query_embedding[None, :], embeddings, metric='dot')
+            ).ravel()
+        similarities = np.dot(embeddings, query_embedding)
+        return similarities
+    
+    def _quantize_rows(self, start: int, stop: int):
+        """임베딩 행 [start, stop)을 행별 스케일의 int8로 양자화"""
+        block = self._embedding_buffer[start:stop]
+        scales = np.abs(block).max(axis=1) / 127.0
+        scales[scales == 0] = 1.0
+        self._quantized_buffer[start:stop] = np.rint(block / scales[:, None])
+        self._scale_buffer[start:stop] = scales
+    
+    def _sync_quantized(self):
+        """마지막 양자화 이후 추가된 행을 양자화 행렬에 반영"""
+        if self._quantized_rows == self._size:
+            return
         
-        self.embeddings = np.vstack(embeddings_list)
+        capacity = self._embedding_buffer.shape[0]
+        if self._quantized_buffer is None or self._quantized_buffer.shape[0] < self._size:
+            quantized = np.empty((capacity, self.dimension), dtype=np.int8)
+            scales = np.empty(capacity, dtype=EMBEDDING_DTYPE)
+            if self._quantized_rows:
+                quantized[:self._quantized_rows] = self._quantized_buffer[:self._quantized_rows]
+                scales[:self._quantized_rows] = self._scale_buffer[:self._quantized_rows]
+            self._quantized_buffer = quantized
+            self._scale_buffer = scales
+        
+        self._quantize_rows(self._quantized_rows, self._size)
+        self._quantized_rows = self._size
+    
+    def _quantized_candidates(self,
+                              query_embedding: np.ndarray,
+                              rows: Optional[np.ndarray],
+                              count: int) -> np.ndarray:
+        """int8 근사 유사도 상위 count개 후보의 행 번호 (rows가 주어지면 그 안에서 선택)"""
+        if count <= 0:
+            return np.empty(0, dtype=np.intp)
+        
+        self._sync_quantized()
+        
+        # 쿼리 스케일은 모든 행에 공통이므로 순위에는 행 스케일만 반영
+        query_scale = np.abs(query_embedding).max() / 127.0 or 1.0
+        query_quantized = np.rint(query_embedding / query_scale).astype(np.int8)
+        quantized = self._quantized_buffer[:self._size]
+        scales = self._scale_buffer[:self._size]
+        if rows is not None:
+            quantized = quantized[rows]
+            scales = scales[rows]
+        if quantized.shape[0] <= count:
+            return rows if rows is not None else np.arange(quantized.shape[0])
+        
+        coarse = np.asarray(
+            simsimd.cdist(query_quantized[None, :], quantized, metric='dot')
+        ).ravel() * scales
+        candidates = np.argpartition(-coarse, count - 1)[:count]
+        return rows[candidates] if rows is not None else candidates
     
-    def _compute_similarities(self, query_embedding: np.ndarray) -> np.ndarray:
-        """코사인 유사도 계산"""
-        if self.embeddings is None:
-            return np.array([])
+    def _sync_ann(self):
+        """HNSW 색인을 생성하거나 마지막 동기화 이후 추가/변경된 문서를 반영"""
+        if self._ann_index is None:
+            # 내적 공간 (행이 정규화되어 있으므로 코사인과 같음)
+            index = hnswlib.Index(space='ip', dim=self.dimension)
+            index.init_index(max_elements=max(2 * self._size, 16), ef_construction=200, M=16)
+            self._ann_index = index
+            self._ann_label_of = {}
+            self._ann_doc_ids = {}
+            self._ann_next_label = 0
+            self._ann_pending = dict.fromkeys(self.doc_ids)
+        
+        if not self._ann_pending:
+            return
         
-        # 코사인 유사도
-        similarities = np.dot(self.embeddings, query_embedding)
-        return similarities
+        keys = list(self._ann_pending)
+        self._ann_pending.clear()
+        labels = []
+        for key in keys:
+            label = self._ann_label_of.get(key)
+            if label is None:
+                label = self._ann_next_label
+                self._ann_next_label += 1
+                self._ann_label_of[key] = label
+                self._ann_doc_ids[label] = key
+            labels.append(label)
+        
+        # 삭제 표시된 항목도 용량을 차지하므로 지금까지 발급한 라벨 수 기준으로 확장
+        max_elements = self._ann_index.get_max_elements()
+        if self._ann_next_label > max_elements:
+            self._ann_index.resize_index(max(self._ann_next_label, 2 * max_elements))
+        
+        rows = [self._index_of[key] for key in keys]
+        self._ann_index.add_items(self.embeddings[rows], np.asarray(labels))
+    
+    def _forget_ann(self, key: str):
+        """삭제된 문서를 HNSW 색인에서 제외"""
+        if self._ann_index is None:
+            return
+        self._ann_pending.pop(key, None)
+        label = self._ann_label_of.pop(key, None)
+        if label is not None:
+            del self._ann_doc_ids[label]
+            self._ann_index.mark_deleted(label)
+    
+    def _ann_candidates(self, query_embedding: np.ndarray, count: int) -> np.ndarray:
+        """HNSW 색인으로 찾은 근사 상위 count개 문서의 행 번호"""
+        if count <= 0:
+            return np.empty(0, dtype=np.intp)
+        
+        self._sync_ann()
+        
+        k = min(count, len(self._ann_label_of))
+        self._ann_index.set_ef(max(ANN_EF_SEARCH, k))
+        labels, _ = self._ann_index.knn_query(query_embedding, k=k)
+        return np.fromiter(
+            (self._index_of[self._ann_doc_ids[label]] for label in labels[0]),
+            dtype=np.intp, count=k
+        )
     
     def save(self, filepath: str):
-        """저장소 저장"""
+        """
+        저장소 저장
+        
+        문서 내용/메타데이터는 filepath에 JSON으로, 임베딩 행렬은 filepath + '.npy'에
+        doc_ids 순서대로 저장
+        """
         data = {
             'dimension': self.dimension,
-            'documents': {k: v.to_dict() for k, v in self.documents.items()},
-            'doc_ids': self.doc_ids
+            'doc_ids': self.doc_ids,
+            'documents': {
+                doc_id: {'content': doc.content, 'metadata': doc.metadata}
+                for doc_id, doc in self.documents.items()
+            }
         }
         
-        with open(filepath, 'wb') as f:
-            pickle.dump(data, f)
+        with open(filepath, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        
+        # 같은 경로에서 로드한 행렬이 메모리 맵으로 열려 있을 수 있으므로
+        # 임시 파일에 쓴 뒤 교체 (기존 매핑은 이전 파일을 계속 참조)
+        matrix_path = filepath + '.npy'
+        tmp_path = matrix_path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            np.save(f, self.embeddings)
+        os.replace(tmp_path, matrix_path)
     
     def load(self, filepath: str):
-        """저장소 로드"""
+        """
+        저장소 로드
+        
+        임베딩 행렬은 메모리 맵(copy-on-write)으로 열어 필요한 행만 페이지 단위로 읽음
+        """
+        matrix_path = filepath + '.npy'
+        if not os.path.exists(matrix_path):
+            self._load_pickle(filepath)
+            return
+        
+        with open(filepath, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        embeddings = np.load(matrix_path, mmap_mode='c')
+        
+        self.dimension = data['dimension']
+        merge = bool(self.documents)
+        documents = data['documents']
+        
+        for doc_id in data['doc_ids']:
+            doc_data = documents[doc_id]
+            if doc_id in self.documents:
+                self._unindex_metadata(doc_id, self.documents[doc_id].metadata)
+            self.documents[doc_id] = Document(
+                doc_id=doc_id,
+                content=doc_data['content'],
+                metadata=doc_data['metadata']
+            )
+            self._index_metadata(doc_id, doc_data['metadata'])
+        
+        if merge:
+            # 기존 문서와 합치는 경우에는 기존 버퍼에 행을 추가
+            self._reserve(self._size + len(data['doc_ids']))
+            for i, doc_id in enumerate(data['doc_ids']):
+                self._append_embedding(doc_id, embeddings[i])
+            self.embeddings = self._embedding_buffer[:self._size]
+            return
+        
+        self.doc_ids = list(data['doc_ids'])
+        self._index_of = {doc_id: i for i, doc_id in enumerate(self.doc_ids)}
+        self._embedding_buffer = embeddings
+        self._size = len(self.doc_ids)
+        self._quantized_rows = 0
+        self._ann_index = None
+        self.embeddings = self._embedding_buffer[:self._size]
+    
+    def _load_pickle(self, filepath: str):
+        """이전 pickle 형식 저장소 로드"""
         with open(filepath, 'rb') as f:
             data = pickle.load(f)
         
         self.dimension = data['dimension']
-        self.doc_ids = data['doc_ids']
+        missing = []
         
-        # Document 복원
+        # Document 복원 (임베딩은 행렬에 추가)
         for doc_id, doc_data in data['documents'].items():
-            embedding = np.array(doc_data['embedding']) if doc_data['embedding'] else None
+            if doc_id in self.documents:
+                self._unindex_metadata(doc_id, self.documents[doc_id].metadata)
             doc = Document(
                 doc_id=doc_data['doc_id'],
                 content=doc_data['content'],
-                metadata=doc_data['metadata'],
-                embedding=embedding
+                metadata=doc_data['metadata']
             )
             self.documents[doc_id] = doc
+            self._index_metadata(doc_id, doc.metadata)
+            if doc_data['embedding']:
+                self._append_embedding(doc_id, np.asarray(doc_data['embedding'], dtype=EMBEDDING_DTYPE))
+            else:
+                missing.append(doc_id)
+        
+        # 임베딩이 없는 문서는 모아서 일괄 계산
+        if missing:
+            embeddings = self._compute_embeddings_batch(
+                [self.documents[doc_id].content for doc_id in missing]
+            )
+            for doc_id, embedding in zip(missing, embeddings):
+                self._append_embedding(doc_id, embedding)
         
-        self._rebuild_index()
+        self.embeddings = self._embedding_buffer[:self._size]
 
 
 class RAGEngine:
@@ -182,13 +642,19 @@ class RAGEngine:
         self.vector_store = vector_store or VectorStore()
         self.doc_cache: Dict[str, Document] = {}
     
-    async def index_directory(self, directory: str, file_patterns: List[str] = None):
+    async def index_directory(self,
+                              directory: str,
+                              file_patterns: List[str] = None,
+                              max_concurrent: Optional[int] = None):
         """
         디렉토리의 문서들을 인덱싱
         
+        파일 읽기는 스레드에서 동시에 진행되므로 문서 저장 순서는 파일 완료 순서를 따름
+        
         Args:
             directory: 대상 디렉토리
             file_patterns: 파일 패턴 리스트 (예: ['*.md', '*.txt'])
+            max_concurrent: 동시에 인덱싱할 최대 파일 수 (None이면 CPU 수의 2배)
         """
         dir_path = Path(directory)
         if not dir_path.exists():
@@ -196,30 +662,45 @@ class RAGEngine:
         
         patterns = file_patterns or ['*.md', '*.txt', '*.rst']
         
-        for pattern in patterns:
-            for file_path in dir_path.rglob(pattern):
-                await self.index_file(str(file_path))
+        # 디렉토리 탐색도 블로킹 I/O이므로 스레드에서 수행
+        file_paths = await asyncio.to_thread(
+            lambda: [str(path) for pattern in patterns for path in dir_path.rglob(pattern)]
+        )
+        
+        semaphore = asyncio.Semaphore(max_concurrent or (os.cpu_count() or 1) * 2)
+        
+        async def index_with_limit(file_path: str):
+            async with semaphore:
+                await self.index_file(file_path)
+        
+        await asyncio.gather(*(index_with_limit(path) for path in file_paths))
     
     async def index_file(self, filepath: str):
         """
         파일을 청크로 나누어 인덱싱
         """
-        with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-            content = f.read()
+        content = await asyncio.to_thread(
+            Path(filepath).read_text, encoding='utf-8', errors='ignore'
+        )
         
         # 청크로 분할
         chunks = self._chunk_text(content)
         
-        for i, chunk in enumerate(chunks):
-            doc_id = f"{filepath}:chunk_{i}"
-            metadata = {
+        # 인덱싱 시각은 파일 단위로 한 번만 계산
+        indexed_at = datetime.now().isoformat()
+        
+        doc_ids = [f"{filepath}:chunk_{i}" for i in range(len(chunks))]
+        metadatas = [
+            {
                 'source_file': filepath,
                 'chunk_index': i,
                 'total_chunks': len(chunks),
-                'indexed_at': datetime.now().isoformat()
+                'indexed_at': indexed_at
             }
-            
-            await self.vector_store.store(doc_id, chunk, metadata)
+            for i in range(len(chunks))
+        ]
+        
+        await self.vector_store.store_batch(doc_ids, chunks, metadatas)
     
     def _chunk_text(self, text: str, chunk_size: int = 512, overlap: int = 50) -> List[str]:
         """
@@ -230,16 +711,9 @@ class RAGEngine:
             chunk_size: 청크 크기 (문자 수)
             overlap: 청크 간 중첩 크기
         """
-        chunks = []
-        start = 0
-        
-        while start < len(text):
-            end = start + chunk_size
-            chunk = text[start:end]
-            chunks.append(chunk)
-            start = end - overlap
-        
-        return chunks
+        # 청크 시작 위치는 (chunk_size - overlap) 간격의 등차수열
+        step = chunk_size - overlap
+        return [text[start:start + chunk_size] for start in range(0, len(text), step)]
     
     async def search_knowledge(self, 
                                query: str, 
@@ -256,23 +730,8 @@ class RAGEngine:
         Returns:
             검색 결과 리스트
         """
-        results = await self.vector_store.search(query, limit=limit * 2)  # 필터링 고려
-        
-        # 필터 적용
-        if filters:
-            filtered_results = []
-            for result in results:
-                metadata = result['metadata']
-                match = all(
-                    metadata.get(k) == v for k, v in filters.items()
-                )
-                if match:
-                    filtered_results.append(result)
-            results = filtered_results[:limit]
-        else:
-            results = results[:limit]
-        
-        return results
+        # 필터는 벡터 저장소의 메타데이터 역색인으로 후보 행을 제한하여 적용
+        return await self.vector_store.search(query, limit=limit, filters=filters)
     
     async def get_context_for_query(self, query: str, max_tokens: int = 2000) -> str:
         """
@@ -295,13 +754,14 @@ class RAGEngine:
             content = result['content']
             source = result['metadata'].get('source_file', 'unknown')
             
-            part = f"[Source: {source}]\n{content}\n"
-            part_length = len(part)
+            header = f"[Source: {source}]\n"
             
+            # 길이를 먼저 확인하여 버려질 결과는 문자열을 만들지 않음
+            part_length = len(header) + len(content) + 1
             if current_length + part_length > max_chars:
                 break
             
-            context_parts.append(part)
+            context_parts.append(f"{header}{content}\n")
             current_length += part_length
         
         return "\n---\n".join(context_parts)
@@ -314,41 +774,48 @@ class RAGEngine:
             tool_name: 툴 이름 (PrimeTime, SpyGlass 등)
             manual_path: 매뉴얼 파일 경로
         """
-        with open(manual_path, 'r', encoding='utf-8', errors='ignore') as f:
-            content = f.read()
+        content = await asyncio.to_thread(
+            Path(manual_path).read_text, encoding='utf-8', errors='ignore'
+        )
         
         # 섹션별로 분할 (예: 챕터, 옵션 설명 등)
         sections = self._split_manual_sections(content)
+        indexed_at = datetime.now().isoformat()
         
-        for i, section in enumerate(sections):
-            doc_id = f"{tool_name}:manual:section_{i}"
-            metadata = {
+        doc_ids = [f"{tool_name}:manual:section_{i}" for i in range(len(sections))]
+        metadatas = [
+            {
                 'tool': tool_name,
                 'document_type': 'manual',
                 'section_index': i,
-                'indexed_at': datetime.now().isoformat()
+                'indexed_at': indexed_at
             }
-            
-            await self.vector_store.store(doc_id, section, metadata)
+            for i in range(len(sections))
+        ]
+        
+        await self.vector_store.store_batch(doc_ids, sections, metadatas)
     
     def _split_manual_sections(self, content: str) -> List[str]:
         """매뉴얼을 섹션으로 분할"""
         # 간단한 구현: 빈 줄 기준으로 분할
         sections = content.split('\n\n')
-        # 너무 작은 섹션은 병합
+        # 너무 작은 섹션은 병합 (문자열 누적 대신 리스트에 모아 한 번에 join)
         merged = []
-        current = ""
+        current: List[str] = []
+        current_length = 0  # 구분자("\n\n") 포함 병합 중인 길이
         
         for section in sections:
-            if len(current) + len(section) < 1000:
-                current += section + "\n\n"
+            if current_length + len(section) < 1000:
+                current.append(section)
+                current_length += len(section) + 2
             else:
                 if current:
-                    merged.append(current.strip())
-                current = section + "\n\n"
+                    merged.append("\n\n".join(current).strip())
+                current = [section]
+                current_length = len(section) + 2
         
         if current:
-            merged.append(current.strip())
+            merged.append("\n\n".join(current).strip())
         
         return merged
     
@@ -378,16 +845,12 @@ class RAGEngine:
         """에러 메시지에서 키워드 추출"""
         # 간단한 구현
         # 실제로는 NLP 기법 사용
-        keywords = []
         
         # Error/Warning 코드 추출
-        import re
-        codes = re.findall(r'[A-Z]+-\d+', error_message)
-        keywords.extend(codes)
+        keywords = _ERROR_CODE_RE.findall(error_message)
         
         # 중요 단어 추출 (대문자 시작 단어)
-        words = re.findall(r'\b[A-Z][a-z]+\b', error_message)
-        keywords.extend(words[:5])
+        keywords.extend(_CAPITALIZED_WORD_RE.findall(error_message)[:5])
         
         return keywords
     
@@ -16,6 +16,23 @@ from execution.template_engine import TemplateEngine, create_default_templates
 from execution.tool_executor import EDAToolExecutor, DryRunExecutor, ParallelExecutor
 from analysis.log_analyzer import AnalysisAgent, FeedbackLoop, LogReducer
 
+try:
+    # 선택 의존성: orjson (C 구현 JSON 인코더) - 결과/통계 저장용
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _write_json(path: Path, data: Any):
+    """JSON 파일 저장 (orjson이 있으면 C 인코더로 직렬화)"""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+        return
+    
+    with open(path, 'w') as f:
+        json.dump(data, f, indent=2)
+
 
 class RTLAgentSystem:
     """
@@ -128,11 +145,11 @@ class RTLAgentSystem:
         
         print(f"Indexing {len(rtl_files)} RTL files from {directory}...")
         
-        for rtl_file in rtl_files:
-            try:
-                await self.knowledge_graph.parse_rtl_file(str(rtl_file))
-            except Exception as e:
-                print(f"Error parsing {rtl_file}: {e}")
+        # 파일별 파싱은 프로세스 풀에서 병렬 수행 (결과는 rtl_files 순서, 실패 시 예외 객체)
+        results = await self.knowledge_graph.parse_rtl_files([str(f) for f in rtl_files])
+        for rtl_file, result in zip(rtl_files, results):
+            if isinstance(result, Exception):
+                print(f"Error parsing {rtl_file}: {result}")
     
     async def execute_command(self, command: str) -> AnalysisResult:
         """
@@ -177,7 +194,7 @@ class RTLAgentSystem:
             details={
                 'task_id': task.task_id,
                 'plan_id': plan.plan_id,
-                'results': [r.__dict__ for r in results]
+                'results': results  # AnalysisResult 객체 (직렬화 시 to_dict)
             },
             errors=[e for r in results for e in r.errors],
             warnings=[w for r in results for w in r.warnings],
@@ -195,12 +212,11 @@ class RTLAgentSystem:
         """실행 결과 저장"""
         result_path = self.dirs['reports'] / f"{task_id}_result.json"
         
-        with open(result_path, 'w') as f:
-            json.dump({
-                'task_id': task_id,
-                'timestamp': datetime.now().isoformat(),
-                'result': result.__dict__
-            }, f, indent=2)
+        _write_json(result_path, {
+            'task_id': task_id,
+            'timestamp': datetime.now().isoformat(),
+            'result': result.to_dict()
+        })
     
     async def analyze_timing(self, 
                             module_name: str,
@@ -316,8 +332,7 @@ class RTLAgentSystem:
         
         # 이력 저장
         history_path = self.dirs['reports'] / f'{task.task_id}_feedback_history.json'
-        with open(history_path, 'w') as f:
-            json.dump(feedback_loop.get_history(), f, indent=2)
+        _write_json(history_path, feedback_loop.get_history())
         
         return result
     
@@ -343,14 +358,13 @@ class RTLAgentSystem:
         kg_path = self.dirs['knowledge'] / 'design_kg.json'
         self.knowledge_graph.save(str(kg_path))
         
-        # RAG Engine
-        rag_path = self.dirs['knowledge'] / 'rag_store.pkl'
+        # RAG Engine (문서는 JSON, 임베딩 행렬은 rag_store.json.npy)
+        rag_path = self.dirs['knowledge'] / 'rag_store.json'
         self.rag_engine.save(str(rag_path))
         
         # 통계
         stats_path = self.workspace / 'system_stats.json'
-        with open(stats_path, 'w') as f:
-            json.dump(self.get_statistics(), f, indent=2)
+        _write_json(stats_path, self.get_statistics())
         
         print(f"System state saved to {self.workspace}")
     
@@ -361,8 +375,10 @@ class RTLAgentSystem:
         if kg_path.exists():
             self.knowledge_graph.load(str(kg_path))
         
-        # RAG Engine
-        rag_path = self.dirs['knowledge'] / 'rag_store.pkl'
+        # RAG Engine (이전 pickle 형식 저장소도 로드 가능)
+        rag_path = self.dirs['knowledge'] / 'rag_store.json'
+        if not rag_path.exists():
+            rag_path = self.dirs['knowledge'] / 'rag_store.pkl'
         if rag_path.exists():
             self.rag_engine.load(str(rag_path))
         
@@ -7,10 +7,15 @@ import asyncio
 import sys
 from pathlib import Path
 
+try:
+    # 선택 의존성: uvloop (libuv 기반 이벤트 루프) - await 디스패치 오버헤드 감소
+    import uvloop
+except ImportError:
+    uvloop = None
 
-def print_banner():
-    """배너 출력"""
-    banner = """
+
+# 시작 배너 / 완료 안내 문구 (각각 한 번의 출력으로 내보냄)
+_BANNER = """
     ╔══════════════════════════════════════════════════════════╗
     ║                                                          ║
     ║     RTL Agent System - Quick Start                      ║
@@ -18,29 +23,27 @@ def print_banner():
     ║                                                          ║
     ╚══════════════════════════════════════════════════════════╝
     """
-    print(banner)
-
 
-async def setup_workspace():
-    """워크스페이스 설정"""
-    print("\n[1/4] Setting up workspace...")
-    
-    workspace = Path('./workspace')
-    workspace.mkdir(exist_ok=True)
-    
-    dirs = ['knowledge', 'templates', 'scripts', 'reports', 'logs', 'rtl_sample']
-    for dir_name in dirs:
-        (workspace / dir_name).mkdir(exist_ok=True)
-    
-    print(f"  ✓ Workspace created at: {workspace.absolute()}")
-    return str(workspace)
+_NEXT_STEPS = "\n".join([
+    "\n" + "=" * 60,
+    "Quick start completed successfully!",
+    "=" * 60,
+    "\nNext steps:",
+    "  1. Check the workspace directory: ./workspace",
+    "  2. Review the generated reports: ./workspace/reports",
+    "  3. Run examples.py for more demonstrations",
+    "  4. Read README.md for detailed documentation",
+])
 
+# 데모에서 실행하는 샘플 명령어들
+_DEMO_COMMANDS = (
+    "DMA 모듈의 구조를 분석해줘",
+    "타이밍 최적화 방안을 제안해줘",
+    "FIFO 버퍼의 깊이를 검증해줘",
+)
 
-async def create_sample_rtl():
-    """샘플 RTL 코드 생성"""
-    print("\n[2/4] Creating sample RTL files...")
-    
-    sample_rtl = """
+# 샘플 RTL 코드 (모듈 임포트 시 한 번만 UTF-8로 인코딩)
+_SAMPLE_RTL = """
 // Sample DMA Controller
 module dma_controller (
     input wire clk,
@@ -151,9 +154,56 @@ module fifo_buffer #(
 
 endmodule
 """
+_SAMPLE_RTL_BYTES = _SAMPLE_RTL.encode('utf-8')
+
+
+def _is_sample_rtl_current(rtl_file: Path) -> bool:
+    """기존 파일이 샘플 RTL과 바이트 단위로 같은지 확인 (크기가 다르면 읽지 않음)"""
+    try:
+        if rtl_file.stat().st_size != len(_SAMPLE_RTL_BYTES):
+            return False
+        return rtl_file.read_bytes() == _SAMPLE_RTL_BYTES
+    except OSError:
+        return False
+
+
+def print_banner():
+    """배너 출력"""
+    print(_BANNER)
+
+
+async def setup_workspace():
+    """워크스페이스 설정"""
+    print("\n[1/4] Setting up workspace...")
+    
+    workspace = Path('./workspace')
+    
+    # 하위 디렉토리 생성은 서로 독립적이므로 스레드에서 동시에 수행 (이벤트 루프 비차단)
+    # 루트는 parents=True로 함께 생성하여 별도의 선행 mkdir 단계를 두지 않음
+    dirs = ['knowledge', 'templates', 'scripts', 'reports', 'logs', 'rtl_sample']
+    await asyncio.gather(*[
+        asyncio.to_thread((workspace / dir_name).mkdir, parents=True, exist_ok=True)
+        for dir_name in dirs
+    ])
+    
+    print(f"  ✓ Workspace created at: {workspace.absolute()}")
+    return str(workspace)
+
+
+async def create_sample_rtl():
+    """샘플 RTL 코드 생성"""
+    print("\n[2/4] Creating sample RTL files...")
     
     rtl_file = Path('./workspace/rtl_sample/dma_controller.v')
-    rtl_file.write_text(sample_rtl)
+    # setup_workspace와 동시에 실행되므로 출력 디렉토리는 직접 생성 (이미 있으면 무시)
+    await asyncio.to_thread(rtl_file.parent.mkdir, parents=True, exist_ok=True)
+    
+    # 이전 실행에서 만든 파일이 그대로면 다시 쓰지 않음
+    if await asyncio.to_thread(_is_sample_rtl_current, rtl_file):
+        print(f"  ✓ Sample RTL up to date: {rtl_file}")
+        return
+    
+    await asyncio.to_thread(rtl_file.write_bytes, _SAMPLE_RTL_BYTES)
     
     print(f"  ✓ Sample RTL created at: {rtl_file}")
 
@@ -195,38 +245,51 @@ async def run_demo(system):
         print("  ✗ System not available")
         return
     
-    # 샘플 명령어들
-    commands = [
-        "DMA 모듈의 구조를 분석해줘",
-        "타이밍 최적화 방안을 제안해줘",
-        "FIFO 버퍼의 깊이를 검증해줘"
-    ]
+    # 명령들은 서로 독립적이므로 시스템의 동시 실행 한도 내에서 함께 실행
+    semaphore = asyncio.Semaphore(system.config.get('max_concurrent', 2))
+    
+    async def run_one(command: str):
+        async with semaphore:
+            return await system.execute_command(command)
     
-    for i, command in enumerate(commands, 1):
-        print(f"\n  Example {i}: {command}")
-        try:
-            result = await system.execute_command(command)
-            print(f"    Status: {'✓ Success' if result.success else '✗ Failed'}")
-            print(f"    Summary: {result.summary}")
-            
-            if result.recommendations:
-                print(f"    Recommendations:")
-                for rec in result.recommendations[:2]:
-                    print(f"      - {rec}")
-                    
-        except Exception as e:
-            print(f"    ✗ Error: {e}")
+    results = await asyncio.gather(
+        *[run_one(command) for command in _DEMO_COMMANDS],
+        return_exceptions=True
+    )
     
-    # 통계 출력
-    print("\n  System Statistics:")
+    # 상태 저장은 스레드에서 시작하고, 그동안 메모리상의 결과/통계로 보고서 구성
+    save_task = asyncio.create_task(asyncio.to_thread(system.save_state))
+    
+    # 결과는 명령 순서대로 모아 한 번에 출력 (줄마다 stdout 쓰기 방지)
+    lines = []
+    for i, (command, result) in enumerate(zip(_DEMO_COMMANDS, results), 1):
+        lines.append(f"\n  Example {i}: {command}")
+        if isinstance(result, Exception):
+            lines.append(f"    ✗ Error: {result}")
+            continue
+        
+        lines.append(f"    Status: {'✓ Success' if result.success else '✗ Failed'}")
+        lines.append(f"    Summary: {result.summary}")
+        
+        if result.recommendations:
+            lines.append(f"    Recommendations:")
+            lines.extend(f"      - {rec}" for rec in result.recommendations[:2])
+    
+    # 통계
     stats = system.get_statistics()
-    print(f"    - Executions: {stats['execution_count']}")
-    print(f"    - Modules indexed: {stats['knowledge_graph']['modules']}")
-    print(f"    - Graph nodes: {stats['knowledge_graph']['nodes']}")
-    print(f"    - Graph edges: {stats['knowledge_graph']['edges']}")
+    lines.append("\n  System Statistics:")
+    lines.append(f"    - Executions: {stats['execution_count']}")
+    lines.append(f"    - Modules indexed: {stats['knowledge_graph']['modules']}")
+    lines.append(f"    - Graph nodes: {stats['knowledge_graph']['nodes']}")
+    lines.append(f"    - Graph edges: {stats['knowledge_graph']['edges']}")
     
-    # 상태 저장
-    system.save_state()
+    # 저장이 끝난 뒤 출력하여 save_state의 메시지와 순서가 섞이지 않게 함
+    # (저장에 실패해도 보고서는 출력)
+    try:
+        await save_task
+    finally:
+        sys.stdout.write('\n'.join(lines) + '\n')
+        sys.stdout.flush()
     print(f"\n  ✓ System state saved to: {system.workspace}")
 
 
@@ -235,11 +298,8 @@ async def main():
     print_banner()
     
     try:
-        # 1. 워크스페이스 설정
-        workspace = await setup_workspace()
-        
-        # 2. 샘플 RTL 생성
-        await create_sample_rtl()
+        # 1. 워크스페이스 설정 / 2. 샘플 RTL 생성 (서로 독립적이므로 동시 실행)
+        workspace, _ = await asyncio.gather(setup_workspace(), create_sample_rtl())
         
         # 3. 시스템 초기화
         system = await initialize_system(workspace)
@@ -247,14 +307,7 @@ async def main():
         # 4. 데모 실행
         await run_demo(system)
         
-        print("\n" + "="*60)
-        print("Quick start completed successfully!")
-        print("="*60)
-        print("\nNext steps:")
-        print("  1. Check the workspace directory: ./workspace")
-        print("  2. Review the generated reports: ./workspace/reports")
-        print("  3. Run examples.py for more demonstrations")
-        print("  4. Read README.md for detailed documentation")
+        print(_NEXT_STEPS)
         
     except Exception as e:
         print(f"\n✗ Error: {e}")
@@ -264,4 +317,7 @@ async def main():
 
 
 if __name__ == '__main__':
-    asyncio.run(main())
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())